@@ -1,9 +1,6 @@
 import math
 
-import matplotlib.pyplot as plt
-
 from tsp_core import (generate_network, Timer, Solver, SolutionStats)
-from tsp_plot import (plot_solutions, plot_solution_progress_compared, plot_tour)
 
 
 def format_text_summary(name: str, stats: SolutionStats):
@@ -26,7 +23,33 @@ def format_plot_summary(name: str, stats: SolutionStats):
     )
 
 
-def main(n, *find_tours: Solver, timeout=60, **kwargs):
+def plot_results(locations, edges, all_stats: dict[str, list[SolutionStats]]):
+    import matplotlib.pyplot as plt
+    from tsp_plot import (plot_solutions, plot_solution_progress_compared, plot_tour)
+
+    n_plots = 2  # solutions, solution progress
+    n_plots += len(all_stats)  # tours
+
+    fig, axs = plt.subplots(n_plots, 1, figsize=(8, 8 * n_plots))
+    axs = axs.flatten()
+
+    plot_solutions(all_stats, axs[0])
+
+    plot_solution_progress_compared(
+        {
+            name: all_stats[name][-1].tour
+            for name in all_stats
+            if not math.isinf(all_stats[name][-1].score)
+        }, edges, ax=axs[1])
+
+    for (name, stats), ax in zip(all_stats.items(), axs[2:]):
+        plot_tour(locations, stats[-1].tour, ax=ax)
+        ax.set_title(f'{name} ({stats[-1].score})')
+
+    plt.show()
+
+
+def main(n, *find_tours: Solver, timeout=60, plot=False, **kwargs):
     # Generate
     print(f'Generating network of size {n} with args: {kwargs}')
     locations, edges = generate_network(n, **kwargs)
@@ -48,26 +71,10 @@ def main(n, *find_tours: Solver, timeout=60, **kwargs):
             print()
 
     # Report and Plot
-    n_plots = 2  # solutions, solution progress
-    n_plots += len(all_stats)  # tours
+    if plot:
+        plot_results(locations, edges, all_stats)
 
-    fig, axs = plt.subplots(n_plots, 1, figsize=(8, 8 * n_plots))
-    axs = axs.flatten()
-
-    plot_solutions(all_stats, axs[0])
-
-    plot_solution_progress_compared(
-        {
-            name: all_stats[name][-1].tour
-            for name in all_stats
-            if not math.isinf(all_stats[name][-1].score)
-        }, edges, ax=axs[1])
-
-    for (name, stats), ax in zip(all_stats.items(), axs[2:]):
-        plot_tour(locations, stats[-1].tour, ax=ax)
-        ax.set_title(f'{name} ({stats[-1].score})')
-
-    plt.show()
+    return all_stats
 
 
 if __name__ == '__main__':
@@ -84,5 +91,6 @@ if __name__ == '__main__':
         reduction=0.2,
         normal=False,
         seed=200,
-        timeout=10
+        timeout=10,
+        plot=True
     )
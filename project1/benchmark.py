@@ -0,0 +1,181 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+from time import perf_counter
+
+from fermat import MOD_EXP_METHODS, baillie_psw, fermat, miller_rabin, mod_exp
+from rsa import CANDIDATE_TESTS, generate_key_pairs, generate_large_prime
+
+KEYGEN_BITS = [64, 128, 256, 512, 1024, 2048]
+MOD_EXP_BITS = [64, 256, 1024, 2048]
+
+# The primality modes timed by bench_primality: name -> test(N)
+PRIMALITY_MODES = {
+    "fermat": lambda N: fermat(N, 20),
+    "miller_rabin": lambda N: miller_rabin(N, 20),
+    "miller_rabin_deterministic": lambda N: miller_rabin(N, 20, deterministic=True),
+    "baillie_psw": baillie_psw,
+}
+
+
+def rate(func, min_time: float) -> float:
+    """Calls per second of func, repeating until at least min_time has passed."""
+    calls = 0
+    start = perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    samples = sorted(samples)
+    if len(samples) == 1:
+        return {"p50": samples[0], "p90": samples[0], "p99": samples[0], "max": samples[0]}
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return {"p50": cuts[49], "p90": cuts[89], "p99": cuts[98], "max": samples[-1]}
+
+
+def bench_mod_exp(seed: int, min_time: float) -> dict[str, float]:
+    metrics = {}
+    for bits in MOD_EXP_BITS:
+        rng = random.Random(seed + bits)
+        N = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+        x = rng.randrange(N)
+        y = rng.getrandbits(bits)
+        for method in MOD_EXP_METHODS:
+            metrics[f"mod_exp/{method}/{bits}"] = rate(lambda: mod_exp(x, y, N, method), min_time)
+    return metrics
+
+
+def bench_primality(seed: int, min_time: float) -> dict[str, float]:
+    # A mix of primes (every round runs) and odd composites (early exit)
+    metrics = {}
+    for bits in [64, 128, 512]:
+        random.seed(seed + bits)
+        numbers = [generate_large_prime(bits) for _ in range(8)]
+        numbers += [random.getrandbits(bits) | 1 for _ in range(8)]
+        for name, test in PRIMALITY_MODES.items():
+            random.seed(seed)
+            calls = rate(lambda: [test(N) for N in numbers], min_time)
+            metrics[f"primality/{name}/{bits}"] = calls * len(numbers)
+    return metrics
+
+
+def latencies(func, trials: int) -> list[float]:
+    samples = []
+    for _ in range(trials):
+        start = perf_counter()
+        func()
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def bench_prime_search(seed: int, trials: int, bit_sizes: list[int]) -> dict[str, float]:
+    # One prime per sample, for each candidate test the search can use
+    metrics = {}
+    for test in CANDIDATE_TESTS:
+        for bits in bit_sizes:
+            random.seed(seed + bits)
+            samples = latencies(lambda: generate_large_prime(bits, test=test), trials)
+            for name, value in percentiles(samples).items():
+                metrics[f"prime_search/{test}/{bits}/{name}"] = value
+    return metrics
+
+
+def bench_keygen(seed: int, trials: int, bit_sizes: list[int], workers: int) -> dict[str, float]:
+    # The full generate_key_pairs path: prime search, distinct-prime retries, e and d
+    variants = {
+        "sequential": {},
+        f"workers{workers}": {"workers": workers},
+        "primes3": {"primes": 3},
+        "primes4": {"primes": 4},
+    }
+    metrics = {}
+    for variant, kwargs in variants.items():
+        for bits in bit_sizes:
+            random.seed(seed + bits)
+            samples = latencies(lambda: generate_key_pairs(bits, **kwargs), trials)
+            for name, value in percentiles(samples).items():
+                metrics[f"keygen/{variant}/{bits}/{name}"] = value
+    return metrics
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    List the metrics that got worse than baseline by more than tolerance (a fraction).
+    Rates (ops/s) regress when they drop, latencies (s) when they grow.
+    """
+    regressions = []
+    for name, metric in current["metrics"].items():
+        if name not in baseline["metrics"]:
+            continue
+        old = baseline["metrics"][name]["value"]
+        new = metric["value"]
+        if metric["unit"] == "ops/s":
+            worse = new < old * (1 - tolerance)
+        else:
+            worse = new > old * (1 + tolerance)
+        if worse:
+            regressions.append(f'{name}: {old:.6g} -> {new:.6g} {metric["unit"]}')
+    return regressions
+
+
+def main(seed: int, trials: int, min_time: float, bit_sizes: list[int], workers: int,
+         output: str | None, baseline: str | None, tolerance: float) -> int:
+    metrics = {}
+    for name, value in bench_mod_exp(seed, min_time).items():
+        metrics[name] = {"value": value, "unit": "ops/s"}
+    for name, value in bench_primality(seed, min_time).items():
+        metrics[name] = {"value": value, "unit": "ops/s"}
+    for name, value in bench_prime_search(seed, trials, bit_sizes).items():
+        metrics[name] = {"value": value, "unit": "s"}
+    for name, value in bench_keygen(seed, trials, bit_sizes, workers).items():
+        metrics[name] = {"value": value, "unit": "s"}
+
+    results = {
+        "meta": {
+            "seed": seed,
+            "trials": trials,
+            "workers": workers,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "metrics": metrics,
+    }
+
+    for name, metric in metrics.items():
+        print(f'{name}: {metric["value"]:.6g} {metric["unit"]}')
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    if baseline:
+        with open(baseline) as f:
+            regressions = compare(results, json.load(f), tolerance)
+        for line in regressions:
+            print(f'REGRESSION {line}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark mod_exp, primality tests, prime search and RSA key generation')
+    parser.add_argument('--seed', type=int, default=312, help='Random seed')
+    parser.add_argument('--trials', type=int, default=5, help='Key generations per bit size')
+    parser.add_argument('--min-time', type=float, default=0.5, help='Seconds to run each throughput benchmark')
+    parser.add_argument('--bits', type=int, nargs='+', default=KEYGEN_BITS, help='Key sizes to time')
+    parser.add_argument('--workers', type=int, default=2, help='Processes for the parallel keygen variant')
+    parser.add_argument('-o', '--output', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='Baseline JSON from an earlier run')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help='Allowed slowdown against the baseline before reporting a regression')
+    args = parser.parse_args()
+    sys.exit(main(args.seed, args.trials, args.min_time, args.bits, args.workers, args.output,
+                  args.compare, args.tolerance))
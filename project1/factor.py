@@ -0,0 +1,128 @@
+import argparse
+import functools
+import math
+import random
+
+from fermat import miller_rabin, SMALL_PRIMES, SMALL_PRIMES_LIMIT
+
+# Pollard-rho steps multiplied together before each gcd
+RHO_BLOCK: int = 128
+
+
+def brent_rho(N: int) -> int:
+    """
+    Find a non-trivial factor of the odd composite N with Brent's variant of
+    Pollard's rho. The |x - y| differences are multiplied together and only
+    one gcd is taken per block of RHO_BLOCK steps. Retries with a new random
+    polynomial x**2 + c whenever a round only finds N itself.
+    """
+    if N % 2 == 0:
+        return 2
+
+    while True:
+        y: int = random.randrange(1, N)
+        c: int = random.randrange(1, N)
+        g: int = 1
+        r: int = 1
+        q: int = 1
+
+        while g == 1:
+            x: int = y
+            for _ in range(r):
+                y = (y * y + c) % N
+            k: int = 0
+            while k < r and g == 1:
+                ys: int = y
+                for _ in range(min(RHO_BLOCK, r - k)):
+                    y = (y * y + c) % N
+                    q = q * abs(x - y) % N
+                g = math.gcd(q, N)
+                k += RHO_BLOCK
+            r *= 2
+
+        if g == N:
+            # The block overshot, so replay it one step at a time from its start
+            while True:
+                ys = (ys * ys + c) % N
+                g = math.gcd(abs(x - ys), N)
+                if g > 1:
+                    break
+
+        if g != N:
+            return g
+
+
+def is_certified_prime(N: int) -> bool:
+    # Exact below 3.3*10**24, 40 random rounds above that
+    return miller_rabin(N, 40, deterministic=True) == "prime"
+
+
+def integer_root(N: int, k: int) -> int:
+    """ floor(N ** (1/k)) by integer Newton steps, exact at any size. """
+    x: int = 1 << -(-N.bit_length() // k)
+    while True:
+        y: int = ((k - 1) * x + N // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+def perfect_power(N: int) -> tuple[int, int] | None:
+    """
+    (r, k) with r**k == N for a prime k, or None if N is not a perfect power.
+    Rho would need about sqrt(r) steps on a prime power, so these are split first.
+    """
+    for k in SMALL_PRIMES:
+        if k > N.bit_length():
+            break
+        r: int = integer_root(N, k)
+        if r ** k == N:
+            return r, k
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def factor(N: int) -> tuple[int, ...]:
+    """
+    Prime factorization of N as a sorted tuple, with repeated factors repeated.
+
+    Trial division by the shared small-prime table comes first, perfect
+    powers are split by integer roots, then Brent's Pollard-rho splits what
+    is left until every piece is certified prime by Miller-Rabin. Results (including those of the pieces) are memoized.
+    """
+    if N < 1:
+        raise ValueError("Only positive integers can be factored")
+
+    factors: list[int] = []
+    for p in SMALL_PRIMES:
+        if p * p > N:
+            break
+        while N % p == 0:
+            factors.append(p)
+            N //= p
+
+    # Every factor below the table limit is gone, so anything this small is prime
+    if 1 < N < SMALL_PRIMES_LIMIT ** 2 or (N > 1 and is_certified_prime(N)):
+        factors.append(N)
+    elif N > 1:
+        power = perfect_power(N)
+        if power is not None:
+            root, k = power
+            factors += factor(root) * k
+        else:
+            d: int = brent_rho(N)
+            factors += factor(d) + factor(N // d)
+
+    return tuple(sorted(factors))
+
+
+def main(number: int):
+    factors = factor(number)
+    print(f'{number} = {" * ".join(str(p) for p in factors)}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('number', type=int)
+    args = parser.parse_args()
+    main(args.number)
@@ -1,21 +1,181 @@
 import argparse
+import bisect
+import functools
+import itertools
+import math
 import random
+from typing import Iterable, Iterator
 
 
 # This is a convenience function for main(). You don't need to touch it.
-def prime_test(N: int, k: int) -> tuple[str, str]:
+# With bpsw=True the Baillie-PSW verdict is appended as a third result.
+def prime_test(N: int, k: int, bpsw: bool = False) -> tuple[str, ...]:
+    if bpsw:
+        return fermat(N, k), miller_rabin(N, k), baillie_psw(N)
     return fermat(N, k), miller_rabin(N, k)
 
 
+MOD_EXP_METHODS = ("pow", "window", "montgomery")
+
+
+def small_primes(limit: int) -> list[int]:
+    """Return every prime below limit (sieve of Eratosthenes)."""
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p*p::p] = bytes(len(range(p*p, limit, p)))
+    return [p for p in range(limit) if sieve[p]]
+
+
+# Shared trial-division table (the 3512 primes below 2**15)
+SMALL_PRIMES_LIMIT: int = 1 << 15
+SMALL_PRIMES: list[int] = small_primes(SMALL_PRIMES_LIMIT)
+
+
+# Sliding-window width by exponent bit length: (max bits, width)
+_WINDOW_WIDTHS = [(23, 1), (79, 2), (239, 3), (671, 4), (1791, 5)]
+
+
+def _window_width(bits: int) -> int:
+    for max_bits, width in _WINDOW_WIDTHS:
+        if bits <= max_bits:
+            return width
+    return 6
+
+
+def _sliding_window_steps(y: int, width: int) -> list[tuple[int, int]]:
+    """
+    Recode the exponent y (> 0) into sliding-window steps, most significant first.
+    Each step is (squarings, digit): square the accumulator `squarings` times and
+    then multiply by x**digit. Digits are odd (or 0 for a trailing run of zeros).
+    The squarings of the first step are dropped since the accumulator starts at x**digit.
+    """
+    bits: str = bin(y)[2:]
+    n: int = len(bits)
+    steps: list[tuple[int, int]] = []
+    zeros: int = 0
+    i: int = 0
+
+    while i < n:
+        if bits[i] == '0':
+            zeros += 1
+            i += 1
+            continue
+        j: int = min(i + width, n)
+        while bits[j - 1] == '0':
+            j -= 1
+        steps.append((zeros + j - i, int(bits[i:j], 2)))
+        zeros = 0
+        i = j
+
+    if zeros:
+        steps.append((zeros, 0))
+    return steps
+
+
+@functools.lru_cache(maxsize=256)
+def _exponent_plan(y: int) -> tuple[int, tuple[tuple[int, int], ...]]:
+    # Window width and recoded steps for y, cached since primality rounds reuse exponents
+    width: int = _window_width(y.bit_length())
+    return width, tuple(_sliding_window_steps(y, width))
+
+
+@functools.lru_cache(maxsize=256)
+def _montgomery_params(N: int) -> tuple[int, int, int]:
+    # R = 2**k > N, and n_prime = -N**-1 mod R
+    k: int = N.bit_length()
+    mask: int = (1 << k) - 1
+    n_prime: int = -pow(N, -1, 1 << k) & mask
+    return k, mask, n_prime
+
+
+def _odd_powers(x: int, width: int, mul) -> list[int]:
+    # table[i] = x**(2i+1), enough to cover every odd digit of the given width
+    x2: int = mul(x, x)
+    table: list[int] = [x]
+    for _ in range((1 << (width - 1)) - 1):
+        table.append(mul(table[-1], x2))
+    return table
+
+
+def _window_mod_exp_many(bases: list[int], y: int, N: int) -> list[int]:
+    # All bases walk the same recoded exponent together
+    width, steps = _exponent_plan(y)
+    tables = [_odd_powers(x % N, width, lambda a, b: a * b % N) for x in bases]
+
+    first: int = steps[0][1] >> 1
+    zs: list[int] = [table[first] for table in tables]
+    for squarings, digit in steps[1:]:
+        for _ in range(squarings):
+            zs = [z * z % N for z in zs]
+        if digit:
+            zs = [z * table[digit >> 1] % N for z, table in zip(zs, tables)]
+    return zs
+
+
+def _montgomery_mod_exp_many(bases: list[int], y: int, N: int) -> list[int]:
+    # Montgomery form needs an odd modulus so that R = 2**k is invertible mod N
+    if N % 2 == 0:
+        return _window_mod_exp_many(bases, y, N)
+
+    k, mask, n_prime = _montgomery_params(N)
+
+    def redc(t: int) -> int:
+        t = (t + ((t & mask) * n_prime & mask) * N) >> k
+        return t - N if t >= N else t
+
+    def mul(a: int, b: int) -> int:
+        return redc(a * b)
+
+    width, steps = _exponent_plan(y)
+    tables = [_odd_powers((x % N << k) % N, width, mul) for x in bases]
+
+    first: int = steps[0][1] >> 1
+    zs: list[int] = [table[first] for table in tables]
+    for squarings, digit in steps[1:]:
+        for _ in range(squarings):
+            zs = [redc(z * z) for z in zs]
+        if digit:
+            zs = [redc(z * table[digit >> 1]) for z, table in zip(zs, tables)]
+    return [redc(z) for z in zs]
+
+
+def mod_exp_many(bases: list[int], y: int, N: int, method: str = "pow") -> list[int]:
+    """
+    Compute [x**y mod N for x in bases] for a shared exponent and modulus.
+    The window/montgomery engines recode y once (cached per exponent) and
+    advance every base through the same steps; see mod_exp for the methods.
+    """
+    if method not in MOD_EXP_METHODS:
+        raise ValueError(f"Unknown mod_exp method: {method}")
+    if y < 0:
+        raise ValueError("Exponent must be non-negative")
+
+    bases = list(bases)
+    if method == "pow":
+        return [pow(x, y, N) for x in bases]
+    if N == 1:
+        return [0] * len(bases)
+    if y == 0 or not bases:
+        return [1] * len(bases)
+    if method == "window":
+        return _window_mod_exp_many(bases, y, N)
+    return _montgomery_mod_exp_many(bases, y, N)
+
+
 # You will need to implement this function and change the return value.
-def mod_exp(x: int, y: int, N: int) -> int:
-    if y == 0:
-        return 1
-    z = mod_exp(x, (y//2), N)
-    if y % 2 == 0:
-        return (z**2) % N
-    return (x*(z**2)) % N
-    
+def mod_exp(x: int, y: int, N: int, method: str = "pow") -> int:
+    """
+    Compute x**y mod N without recursion.
+    - "pow" defers to the built-in three-argument pow (fastest)
+    - "window" uses left-to-right sliding-window exponentiation
+    - "montgomery" runs the sliding window in Montgomery form (odd N only,
+      even N falls back to "window")
+    """
+    return mod_exp_many([x], y, N, method)[0]
 
 
 # You will need to implement this function and change the return value.
@@ -34,16 +194,64 @@ def mprobability(k: int) -> float:
 # To generate random values for a, you will most likely want to use
 # random.randint(low, hi) which gives a random integer between low and
 # hi, inclusive.
-def fermat(N: int, k: int) -> str:
+def fermat(N: int, k: int, method: str = "pow") -> str:
     if N <= 1:
         return "composite"
+    if N <= 3:
+        return "prime"
 
-    result: str = "prime"
-    for i in range(k):
-        a:int = random.randint(2, N-1)
-        if mod_exp(a, N-1, N) != 1:
-            result = "composite" 
-    return result
+    bases: list[int] = [random.randint(2, N-1) for i in range(k)]
+    for batch in _round_batches(bases):
+        if any(check != 1 for check in mod_exp_many(batch, N-1, N, method)):
+            # One witness is enough, the remaining rounds can't change the verdict
+            return "composite"
+    return "prime"
+
+
+def _round_batches(bases: list[int]) -> list[list[int]]:
+    # Most composites fail the very first round, so it runs alone
+    # and the remaining rounds share one batched exponentiation
+    return [batch for batch in (bases[:1], bases[1:]) if batch]
+
+
+# Known witness sets that make Miller-Rabin exact below each bound: (bound, bases).
+# The 2**64 set is Jim Sinclair's seven bases, the others are the first few primes.
+MR_DETERMINISTIC_BASES: list[tuple[int, tuple[int, ...]]] = [
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (1 << 64, (2, 325, 9375, 28178, 450775, 9780504, 1795265022)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+]
+
+
+def deterministic_bases(N: int) -> tuple[int, ...] | None:
+    """
+    Return a witness set that makes Miller-Rabin exact for N,
+    or None if N is above every known bound.
+    """
+    for bound, bases in MR_DETERMINISTIC_BASES:
+        if N < bound:
+            return bases
+    return None
+
+
+def _is_mr_witness(check: int, s: int, N: int) -> bool:
+    # True if check = a**d mod N proves N composite, where N-1 = d * 2**s with d odd
+    if check == 1 or check == N-1:
+        return False
+
+    for i in range(s-1):
+        check = check * check % N
+        if check == N-1:
+            return False
+
+    return True
 
 
 # You will need to implement this function and change the return value, which should be
@@ -52,9 +260,19 @@ def fermat(N: int, k: int) -> str:
 # To generate random values for a, you will most likely want to use
 # random.randint(low, hi) which gives a random integer between low and
 # hi, inclusive.
-def miller_rabin(N: int, k: int) -> str:
+def miller_rabin(N: int, k: int, deterministic: bool = False, method: str = "pow") -> str:
+    """
+    Miller-Rabin with k random bases, returning as soon as a witness is found.
+    With deterministic=True, N below 3.3*10**24 is tested against a fixed
+    witness set instead (exact answer, no randomness); larger N falls back
+    to k random rounds.
+    """
     if N <= 1:
         return "composite"
+    if N <= 3:
+        return "prime"
+    if N % 2 == 0:
+        return "composite"
 
     s:int = 0
     d:int = N-1
@@ -63,34 +281,234 @@ def miller_rabin(N: int, k: int) -> str:
         d //= 2
         s += 1
 
-    result: str = "prime"
+    bases = deterministic_bases(N) if deterministic else None
+    if bases is None:
+        bases = [random.randint(2, N-1) for i in range(k)]
+    bases = [a % N for a in bases if a % N != 0]
 
-    for i in range(k):
-        a:int = random.randint(2, N-1)
-        check: int = mod_exp(a, d, N)
+    for batch in _round_batches(bases):
+        for check in mod_exp_many(batch, d, N, method):
+            if _is_mr_witness(check, s, N):
+                return "composite"
 
-        if check == 1 or check == N-1:
-            continue
+    return "prime"
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Jacobi symbol (a/n) for odd n > 0.
+    """
+    a %= n
+    result: int = 1
+    while a != 0:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas(N: int) -> bool:
+    """
+    Strong Lucas probable-prime test with Selfridge's parameters:
+    D is the first of 5, -7, 9, -11, ... with (D/N) = -1, P = 1, Q = (1-D)/4.
+    N must be odd, not a perfect square and have no small factors.
+    """
+    D: int = 5
+    while jacobi(D, N) != -1:
+        if math.gcd(abs(D), N) not in (1, N):
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P: int = 1
+    Q: int = (1 - D) // 4
+
+    # N+1 = d * 2**s with d odd
+    s: int = 0
+    d: int = N + 1
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    def half(x: int) -> int:
+        # x/2 mod N, N odd
+        return (x if x % 2 == 0 else x + N) // 2 % N
+
+    # Left-to-right over the bits of d: double, then add one when the bit is set
+    U: int = 1
+    V: int = P
+    Qk: int = Q % N
+    for bit in bin(d)[3:]:
+        U, V = U * V % N, (V * V - 2 * Qk) % N
+        Qk = Qk * Qk % N
+        if bit == '1':
+            U, V = half(P * U + V), half(D * U + P * V)
+            Qk = Qk * Q % N
+
+    if U == 0 or V == 0:
+        return True
+    for r in range(s - 1):
+        V = (V * V - 2 * Qk) % N
+        Qk = Qk * Qk % N
+        if V == 0:
+            return True
+    return False
+
+
+# Trial division bound for baillie_psw before any exponentiation
+BPSW_TRIAL_PRIMES: int = 50
+
+
+def baillie_psw(N: int) -> str:
+    """
+    Baillie-PSW: a strong base-2 Miller-Rabin round followed by a strong
+    Lucas test. About two exponentiations per candidate and no known
+    counterexample, so there is no probability knob.
+    """
+    if N <= 1:
+        return "composite"
+    for p in SMALL_PRIMES[:BPSW_TRIAL_PRIMES]:
+        if N % p == 0:
+            return "prime" if N == p else "composite"
+
+    s: int = 0
+    d: int = N-1
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    if _is_mr_witness(mod_exp(2, d, N), s, N):
+        return "composite"
+
+    if math.isqrt(N) ** 2 == N:
+        return "composite"
+    return "prime" if _strong_lucas(N) else "composite"
+
+
+# Odd numbers per sieve segment (each segment spans 2 * SEGMENT_SIZE integers)
+SEGMENT_SIZE: int = 1 << 16
+
+# The wheel pre-sieves 3, 5 and 7: over odd numbers the pattern repeats every 105
+WHEEL_PRIMES: tuple[int, ...] = (3, 5, 7)
+WHEEL_PERIOD: int = 105
+# WHEEL[j] is 1 when the odd number 2j+1 has none of the wheel primes as a factor
+WHEEL: bytearray = bytearray(
+    int(all((2 * j + 1) % p for p in WHEEL_PRIMES)) for j in range(WHEEL_PERIOD)
+) * (SEGMENT_SIZE // WHEEL_PERIOD + 2)
+
+# Bulk checks sieve when values are at least this dense per segment,
+# and never need base primes above this bound
+BULK_MIN_PER_SEGMENT: int = 64
+BULK_SIEVE_MAX: int = 1 << 48
+
+
+@functools.lru_cache(maxsize=4)
+def base_primes(limit: int) -> tuple[int, ...]:
+    """
+    Odd primes up to and including limit, for sieving segments up to limit**2.
+    Served from SMALL_PRIMES when it is large enough.
+    """
+    if limit < SMALL_PRIMES_LIMIT:
+        return tuple(SMALL_PRIMES[1:bisect.bisect_right(SMALL_PRIMES, limit)])
+    return tuple(primes_in_range(3, limit + 1))
+
+
+def _segments(lo: int, hi: int) -> Iterator[tuple[int, bytearray]]:
+    """
+    Sieve the odd numbers in [lo, hi) one segment at a time.
+    Yields (base, seg) where seg[i] == 1 means base + 2i is prime, for odd base.
+    The wheel primes themselves and 1 are not marked; callers fix those up.
+    """
+    base: int = lo | 1
+    sieve_primes = [p for p in base_primes(math.isqrt(max(hi - 1, 0))) if p not in WHEEL_PRIMES]
 
-        for i in range(s-1):
-            check = mod_exp(check, 2, N)
-            if check == N-1:
+    while base < hi:
+        size: int = min(SEGMENT_SIZE, (hi - base + 1) // 2)
+        phase: int = (base // 2) % WHEEL_PERIOD
+        seg: bytearray = WHEEL[phase:phase + size]
+        end: int = base + 2 * size
+
+        for p in sieve_primes:
+            if p * p >= end:
                 break
-        
-        if check != N-1:
-            result = "composite"
+            # First odd multiple of p in the segment, but never p itself
+            m: int = max(p * p, (base + p - 1) // p * p)
+            if m % 2 == 0:
+                m += p
+            start: int = (m - base) // 2
+            if start < size:
+                seg[start::p] = bytes(len(range(start, size, p)))
+
+        yield base, seg
+        base = end
+
+
+def primes_in_range(lo: int, hi: int) -> Iterator[int]:
+    """
+    Yield every prime p with lo <= p < hi, in order, using a segmented
+    bytearray sieve with a 3-5-7 wheel. Memory stays at one segment
+    plus the base primes up to sqrt(hi).
+    """
+    lo = max(lo, 2)
+    if lo >= hi:
+        return
+    for p in (2,) + WHEEL_PRIMES:
+        if lo <= p < hi:
+            yield p
+
+    for base, seg in _segments(lo, hi):
+        if base == 1:
+            seg[0] = 0
+        yield from itertools.compress(range(base, base + 2 * len(seg), 2), seg)
+
+
+def is_prime_bulk(values: Iterable[int]) -> list[bool]:
+    """
+    Primality of every value, in input order.
+    Clusters of values that are dense enough are answered from a segmented
+    sieve over their span; isolated or huge values use baillie_psw.
+    """
+    values = list(values)
+    ordered: list[int] = sorted(set(v for v in values if v > 7 and v % 2 == 1))
+    verdict: dict[int, bool] = {}
+
+    # Split the sorted values wherever the gap is wider than one segment
+    clusters: list[list[int]] = []
+    for v in ordered:
+        if clusters and v - clusters[-1][-1] <= 2 * SEGMENT_SIZE:
+            clusters[-1].append(v)
+        else:
+            clusters.append([v])
+
+    for cluster in clusters:
+        lo, hi = cluster[0], cluster[-1] + 1
+        segments_needed: int = (hi - lo) // (2 * SEGMENT_SIZE) + 1
+        if hi > BULK_SIEVE_MAX or len(cluster) < BULK_MIN_PER_SEGMENT * segments_needed:
+            for v in cluster:
+                verdict[v] = baillie_psw(v) == "prime"
+            continue
+
+        i: int = 0
+        for base, seg in _segments(lo, hi):
+            end: int = base + 2 * len(seg)
+            while i < len(cluster) and cluster[i] < end:
+                verdict[cluster[i]] = bool(seg[(cluster[i] - base) // 2])
+                i += 1
 
-    return result
+    return [verdict[v] if v in verdict else v in (2, 3, 5, 7) for v in values]
 
 
 def main(number: int, k: int):
-    fermat_call, miller_rabin_call = prime_test(number, k)
+    fermat_call, miller_rabin_call, bpsw_call = prime_test(number, k, bpsw=True)
     fermat_prob = fprobability(k)
     mr_prob = mprobability(k)
 
     print(f'Is {number} prime?')
     print(f'Fermat: {fermat_call} (prob={fermat_prob})')
     print(f'Miller-Rabin: {miller_rabin_call} (prob={mr_prob})')
+    print(f'Baillie-PSW: {bpsw_call}')
 
 
 if __name__ == '__main__':
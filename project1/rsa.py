@@ -1,15 +1,18 @@
+import mmap
+import multiprocessing
+import os
+import queue
 import random
-import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from typing import NamedTuple
 
 # This may come in handy...
-from fermat import miller_rabin
+from fermat import baillie_psw, miller_rabin, mod_exp, SMALL_PRIMES
 
-# If you use a recursive implementation of `mod_exp` or extended-euclid,
-# you recurse once for every bit in the number.
-# If your number is more than 1000 bits, you'll exceed python's recursion limit.
-# Here we raise the limit so the tests can run without any issue.
-# Can you implement `mod_exp` and extended-euclid without recursion?
-sys.setrecursionlimit(4000)
+# `mod_exp`, `euclid` and `ext_euclid` are all iterative,
+# so there is no recursion limit to raise for large keys.
 
 # When trying to find a relatively prime e for (p-1) * (q-1)
 # use this list of 25 primes
@@ -18,15 +21,20 @@ primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67
 
 
 def euclid(a,b):
-    if b == 0:
-        return a
-    return euclid(b, a%b)
+    while b != 0:
+        a, b = b, a % b
+    return a
 
 def find_e(E, p, q):
     for e in E:
         if euclid(e, (p-1)*(q-1)) == 1:
             return e
 
+
+# Size of the leading-digit approximation used by Lehmer's steps
+LEHMER_BITS: int = 64
+
+
 # Implement this function
 def ext_euclid(a: int, b: int) -> tuple[int, int, int]:
     """
@@ -35,61 +43,575 @@ def ext_euclid(a: int, b: int) -> tuple[int, int, int]:
     - d = GCD(a, b)
     - ax + by = d
 
-    Note: a must be greater than b
+    Iterative, using Lehmer's method while the numbers are large: several
+    quotient steps are worked out on the leading 64 bits and then applied
+    to the full numbers at once. a and b must be non-negative (in any order).
     """
-    if a < b:
-        raise ValueError("a cannot be less than b")
+    if a < 0 or b < 0:
+        raise ValueError("a and b must be non-negative")
 
-    x: int = 0
-    y: int = 0
-    z: int = 0
+    swapped: bool = a < b
+    if swapped:
+        a, b = b, a
 
-    if b == 0:
-        return (1,0,a)
-    x, y, z = ext_euclid(b, a%b)
-    return (y, (x - (a//b)*y), z)
+    # Invariant: a = x0*A + y0*B and b = x1*A + y1*B for the original A, B
+    x0, y0, x1, y1 = 1, 0, 0, 1
 
+    while b.bit_length() > LEHMER_BITS:
+        shift: int = a.bit_length() - LEHMER_BITS
+        ah: int = a >> shift
+        bh: int = b >> shift
+        A, B, C, D = 1, 0, 0, 1
 
-# Implement this function
-def generate_large_prime(bits=512) -> int:
+        # Take quotient steps while the leading digits agree on them
+        while bh + C != 0 and bh + D != 0:
+            q: int = (ah + A) // (bh + C)
+            if q != (ah + B) // (bh + D):
+                break
+            A, C = C, A - q*C
+            B, D = D, B - q*D
+            ah, bh = bh, ah - q*bh
+
+        if B == 0:
+            # No step could be certified, fall back to one full-size division
+            q = a // b
+            a, b = b, a - q*b
+            x0, x1 = x1, x0 - q*x1
+            y0, y1 = y1, y0 - q*y1
+        else:
+            a, b = A*a + B*b, C*a + D*b
+            x0, x1 = A*x0 + B*x1, C*x0 + D*x1
+            y0, y1 = A*y0 + B*y1, C*y0 + D*y1
+
+    while b != 0:
+        q = a // b
+        a, b = b, a - q*b
+        x0, x1 = x1, x0 - q*x1
+        y0, y1 = y1, y0 - q*y1
+
+    if swapped:
+        return (y0, x0, a)
+    return (x0, y0, a)
+
+
+def mod_inverse(a: int, m: int) -> int:
+    """
+    Return a**-1 mod m, raising ValueError if a is not invertible.
+    """
+    x, y, d = ext_euclid(a % m, m)
+    if d != 1:
+        raise ValueError(f"{a} has no inverse mod {m}")
+    return x % m
+
+
+def batch_mod_inverse(values: list[int], m: int) -> list[int]:
     """
-    Generate a random prime number with the specified bit length.
-    Use random.getrandbits(bits) to generate a random number of the
-     specified bit length.
+    Invert every value mod m with a single extended Euclid call (Montgomery's trick).
+    Raises ValueError if any value is not invertible.
     """
-    result: str = "composite"
-    prime: int = 0
+    if not values:
+        return []
+
+    # prefix[i] = values[0] * ... * values[i] mod m
+    prefix: list[int] = []
+    running: int = 1
+    for v in values:
+        running = running * v % m
+        prefix.append(running)
+
+    try:
+        inv: int = mod_inverse(running, m)
+    except ValueError:
+        bad = next(v for v in values if euclid(v % m, m) != 1)
+        raise ValueError(f"{bad} has no inverse mod {m}") from None
+
+    # Walk back: inv(values[i]) = inv(prefix[i]) * prefix[i-1]
+    inverses: list[int] = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = inv * prefix[i - 1] % m
+        inv = inv * values[i] % m
+    inverses[0] = inv
+    return inverses
+
+
+def sieve_window(residues: list[tuple[int, int]], size: int) -> bytearray:
+    """
+    Sieve the odd candidates base, base+2, ..., base+2*(size-1).
+    residues holds (p, base % p) for odd sieving primes p.
+    Returns a bytearray where 1 marks a candidate with no small factor.
+    """
+    window = bytearray([1]) * size
+    for p, r in residues:
+        # base + 2i = 0 (mod p)  =>  i = -r * 2^-1 (mod p)
+        start = (p - r) * ((p + 1) // 2) % p
+        window[start::p] = bytes(len(range(start, size, p)))
+    return window
+
+
+def advance_residues(residues: list[tuple[int, int]], step: int) -> list[tuple[int, int]]:
+    # Move every residue forward by step without touching the big base again
+    return [(p, (r + step) % p) for p, r in residues]
+
+
+# Primality tests generate_large_prime can run on sieve survivors
+CANDIDATE_TESTS = {
+    "miller_rabin": lambda N: miller_rabin(N, 10, deterministic=True),
+    "baillie_psw": baillie_psw,
+}
+
+
+def check_prime_bits(bits: int, safe: bool = False) -> None:
+    if bits < (3 if safe else 2):
+        raise ValueError(f"A {'safe ' if safe else ''}prime needs at least {3 if safe else 2} bits")
+
+
+def search_prime(bits: int, stop=None, test: str = "baillie_psw", safe: bool = False) -> int | None:
+    """
+    The candidate search behind generate_large_prime.
+    If stop (a threading/multiprocessing Event) is given, it is checked between
+    sieve windows and None is returned once it is set.
+    """
+    check_prime_bits(bits, safe)
+    if test not in CANDIDATE_TESTS:
+        raise ValueError(f"Unknown primality test: {test}")
+    is_prime = CANDIDATE_TESTS[test]
+
+    # In safe mode the walk is over q, and p = 2q + 1 has one more bit
+    if safe:
+        bits -= 1
+    top: int = 1 << bits
+    size: int = max(64, bits)
+    sieve_primes: list[int] = [p for p in SMALL_PRIMES[1:] if p < top >> 1]
 
-    while result == "composite":
-        prime = random.getrandbits(bits)
-        if prime % 2 == 0:
-            continue
-        if miller_rabin(prime, 10) == "prime":
-            result = "prime"
+    while True:
+        base: int = random.getrandbits(bits) | (top >> 1) | 1
+        residues = [(p, base % p) for p in sieve_primes]
+        if safe:
+            # 2q + 1 = 0 (mod p)  <=>  q = (p-1)/2 (mod p), so sieve that shifted residue too
+            residues += [(p, (base - (p - 1) // 2) % p) for p in sieve_primes]
 
-    return prime
+        while base < top:
+            if stop is not None and stop.is_set():
+                return None
+            window = sieve_window(residues, size)
+            for i in range(size):
+                if not window[i]:
+                    continue
+                candidate: int = base + 2 * i
+                if candidate >= top:
+                    break
+                if safe:
+                    if is_safe_prime_pair(candidate, is_prime):
+                        return 2 * candidate + 1
+                elif is_prime(candidate) == "prime":
+                    return candidate
+            base += 2 * size
+            residues = advance_residues(residues, 2 * size)
+
+
+def is_safe_prime_pair(q: int, is_prime) -> bool:
+    """
+    True if q and p = 2q + 1 are both prime.
+    Base-2 Fermat checks on both reject most pairs for one exponentiation each.
+    Once q passes the full test, p is proven prime by Pocklington's criterion:
+    q > sqrt(p), 2**(p-1) = 1 (mod p) and gcd(2**2 - 1, p) = 1.
+    """
+    p: int = 2 * q + 1
+    if mod_exp(2, q - 1, q) != 1 or mod_exp(2, p - 1, p) != 1:
+        return False
+    return p % 3 != 0 and is_prime(q) == "prime"
 
 
 # Implement this function
-def generate_key_pairs(bits: int) -> tuple[int, int, int]:
+def generate_large_prime(bits=512, test: str = "baillie_psw", safe: bool = False) -> int:
     """
-    Generate RSA public and private key pairs.
-    Return N, e, d
-    - N must be the product of two random prime numbers p and q
-    - e and d must be multiplicative inverses mod (p-1)(q-1)
+    Generate a random prime number with exactly the specified bit length.
+
+    Starts from one random odd number with the top bit forced and walks forward.
+    Each window of odd candidates is sieved by the small-prime table, so only
+    candidates with no small factor reach the primality test. If the walk runs
+    past `bits` bits, a new starting point is drawn.
+
+    test picks the check for sieve survivors: "baillie_psw" (default, about two
+    exponentiations) or "miller_rabin" (10 rounds, exact below 3.3*10**24).
+
+    With safe=True the result is a safe prime p = 2q + 1 with q also prime.
+    q and p are sieved together, so a candidate is dropped as soon as either
+    has a small factor.
+    """
+    return search_prime(bits, test=test, safe=safe)
+
+
+def seeded_prime(bits: int, seed: int) -> int:
+    # Worker processes inherit the parent's random state, so each job gets its own seed
+    random.seed(seed)
+    return generate_large_prime(bits)
+
+
+# How often (seconds) generate_primes_parallel checks on its workers while waiting
+WORKER_POLL: float = 0.5
+
+
+def prime_worker(bits: int, seed: int, stop, results) -> None:
+    random.seed(seed)
+    try:
+        while not stop.is_set():
+            prime = search_prime(bits, stop)
+            if prime is not None:
+                results.put(prime)
+    except Exception as error:
+        # The parent re-raises it; exiting normally makes sure it is flushed first
+        results.put(error)
+        return
+    # Anything still buffered once stop is set is unwanted, don't block exit on it
+    results.cancel_join_thread()
+
+
+def generate_primes_parallel(bits: int, count: int, workers: int) -> list[int]:
+    """
+    Search for `count` distinct primes of `bits` bits across `workers` processes.
+    The workers are stopped as soon as enough primes have been collected.
+    An error in a worker is re-raised here, and a worker that dies without
+    one raises RuntimeError.
+    """
+    check_prime_bits(bits)
+    ctx = multiprocessing.get_context()
+    stop = ctx.Event()
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=prime_worker, args=(bits, random.getrandbits(64), stop, results), daemon=True)
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+
+    found: list[int] = []
+    try:
+        while len(found) < count:
+            try:
+                prime = results.get(timeout=WORKER_POLL)
+            except queue.Empty:
+                # Workers only exit early by failing, and a reported error is in the queue by then
+                dead = [proc for proc in procs if not proc.is_alive()]
+                if dead and results.empty():
+                    raise RuntimeError(f"Prime worker died with exit code {dead[0].exitcode}")
+                continue
+            if isinstance(prime, Exception):
+                raise prime
+            if prime not in found:
+                found.append(prime)
+    finally:
+        stop.set()
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+    return found
+
+
+class PrivateKey(NamedTuple):
+    """
+    Extended private key for Chinese-Remainder decryption.
+    - dp = d mod (p-1), dq = d mod (q-1)
+    - qinv = q**-1 mod p
+    - others holds (r, d mod (r-1), (p*q*...)**-1 mod r) for each extra
+      prime of a multi-prime key, in the order they are recombined
+    """
+    p: int
+    q: int
+    dp: int
+    dq: int
+    qinv: int
+    others: tuple[tuple[int, int, int], ...] = ()
+
+
+# Number of prime factors generate_key_pairs can build N from
+KEY_PRIME_COUNTS = (2, 3, 4)
+
+# Smallest prime size for each number of key primes. The search only returns
+# odd primes, so below these sizes there are too few distinct ones to draw
+# (3 is the only 2-bit one, and 11 and 13 the only 4-bit ones).
+KEY_PRIME_MIN_BITS: dict[int, int] = {2: 3, 3: 8, 4: 8}
+
+
+def check_key_prime_bits(prime_bits: int, primes: int = 2) -> None:
+    # Raise ValueError unless `primes` distinct primes of prime_bits bits can be drawn
+    if primes not in KEY_PRIME_COUNTS:
+        raise ValueError(f"primes must be one of {KEY_PRIME_COUNTS}")
+    if prime_bits < KEY_PRIME_MIN_BITS[primes]:
+        raise ValueError(f"A {primes}-prime key needs primes of at least "
+                         f"{KEY_PRIME_MIN_BITS[primes]} bits, got {prime_bits}")
+
+
+def keys_from_primes(p: int, q: int, extended: bool = False, others: list[int] = ()) -> tuple:
+    """
+    Build N, e, d from two primes p and q (times any extra primes in others).
+    With extended=True, return N, e, d, PrivateKey instead.
     """
-    p:int = generate_large_prime(bits)
-    q:int = generate_large_prime(bits)
     N: int = p * q
+    phi: int = (p-1)*(q-1)
+    for r in others:
+        N *= r
+        phi *= r - 1
 
     d_rsa: int = 0
     e_rsa: int = 0
     for e in primes:
-        holder, d_rsa, check = ext_euclid(((p-1)*(q-1)), e)
-        if check == 1:
+        # e is prime, so it is coprime to phi unless it divides it
+        if phi % e != 0:
             e_rsa = e
-            while d_rsa < 0:
-                d_rsa += (p-1)*(q-1)
+            d_rsa = mod_inverse(e, phi)
             break
 
-    return N, e_rsa, d_rsa
+    if not extended:
+        return N, e_rsa, d_rsa
+
+    other_info: list[tuple[int, int, int]] = []
+    product: int = p * q
+    for r in others:
+        other_info.append((r, d_rsa % (r-1), mod_inverse(product, r)))
+        product *= r
+
+    private_key = PrivateKey(p, q, d_rsa % (p-1), d_rsa % (q-1), mod_inverse(q, p), tuple(other_info))
+    return N, e_rsa, d_rsa, private_key
+
+
+# Implement this function
+def generate_key_pairs(bits: int, workers: int | None = None, extended: bool = False,
+                       primes: int = 2) -> tuple:
+    """
+    Generate RSA public and private key pairs.
+    Return N, e, d
+    - N is the product of `primes` distinct random primes (two by default)
+    - e and d are multiplicative inverses mod the product of (p-1) over those primes
+
+    With workers > 1 the prime search is spread over that many processes.
+    With extended=True, return N, e, d, PrivateKey so decrypt can use CRT.
+    With primes=3 or 4, N is the product of that many distinct primes of
+    2*bits // primes bits each, so N stays about as large as a two-prime key.
+    The primes need at least KEY_PRIME_MIN_BITS[primes] bits, or there would
+    not be enough distinct ones to draw.
+    """
+    if primes not in KEY_PRIME_COUNTS:
+        raise ValueError(f"primes must be one of {KEY_PRIME_COUNTS}")
+    prime_bits: int = 2 * bits // primes
+    check_key_prime_bits(prime_bits, primes)
+
+    if workers is not None and workers > 1:
+        factors = generate_primes_parallel(prime_bits, primes, workers)
+    else:
+        factors: list[int] = []
+        while len(factors) < primes:
+            prime = generate_large_prime(prime_bits)
+            if prime not in factors:
+                factors.append(prime)
+
+    return keys_from_primes(factors[0], factors[1], extended, factors[2:])
+
+
+def encrypt(message: int, N: int, e: int) -> int:
+    return mod_exp(message, e, N)
+
+
+def decrypt(ciphertext: int, N: int, d: int, private_key: PrivateKey | None = None) -> int:
+    """
+    Decrypt with d mod N, or with one smaller exponentiation per prime
+    recombined by the Chinese Remainder Theorem when private_key is given.
+    """
+    if private_key is None:
+        return mod_exp(ciphertext, d, N)
+
+    p, q, dp, dq, qinv, others = private_key
+    m1: int = mod_exp(ciphertext % p, dp, p)
+    m2: int = mod_exp(ciphertext % q, dq, q)
+    h: int = qinv * (m1 - m2) % p
+    message: int = m2 + h * q
+
+    # Garner's recombination, one extra prime at a time
+    product: int = p * q
+    for r, dr, tr in others:
+        mr: int = mod_exp(ciphertext % r, dr, r)
+        h = (mr - message) * tr % r
+        message += product * h
+        product *= r
+    return message
+
+
+# Encrypted files start with the plaintext length as an 8-byte big-endian header
+FILE_HEADER_SIZE: int = 8
+
+# Roughly how many input bytes each pool task converts
+FILE_TASK_BYTES: int = 1 << 20
+
+
+def block_sizes(N: int) -> tuple[int, int]:
+    """
+    Return (plaintext block, ciphertext block) sizes in bytes for modulus N.
+    Plaintext blocks are short enough to always be below N, ciphertext
+    blocks are wide enough to hold any value mod N.
+    """
+    plain: int = (N.bit_length() - 1) // 8
+    if plain < 1:
+        raise ValueError("Modulus is too small to encrypt whole bytes")
+    return plain, (N.bit_length() + 7) // 8
+
+
+def crypt_blocks(path: str, data_offset: int, data_size: int, in_block: int, out_block: int,
+                 out_last: int, first: int, count: int, crypt) -> bytes:
+    """
+    Apply crypt to blocks [first, first + count) of the file at path and return
+    their concatenated output. Blocks are read straight out of a memory map,
+    and every output block is out_block bytes except the file's last, which is out_last.
+    """
+    n_blocks: int = -(-data_size // in_block)
+    out = bytearray()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            for i in range(first, min(first + count, n_blocks)):
+                start: int = data_offset + i * in_block
+                stop: int = min(start + in_block, data_offset + data_size)
+                value: int = crypt(int.from_bytes(view[start:stop], 'big'))
+                out += value.to_bytes(out_last if i == n_blocks - 1 else out_block, 'big')
+    return bytes(out)
+
+
+def crypt_file(in_path: str, out, data_offset: int, data_size: int, in_block: int, out_block: int,
+               out_last: int, crypt, workers: int | None) -> None:
+    # Split the blocks into tasks and write their output in file order
+    n_blocks: int = -(-data_size // in_block)
+    per_task: int = max(1, FILE_TASK_BYTES // in_block)
+    starts = range(0, n_blocks, per_task)
+    task = partial(crypt_blocks, in_path, data_offset, data_size, in_block, out_block, out_last,
+                   count=per_task, crypt=crypt)
+
+    if workers is not None and workers > 1 and len(starts) > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            for chunk in executor.map(task, starts):
+                out.write(chunk)
+    else:
+        for first in starts:
+            out.write(task(first))
+
+
+def encrypt_file(in_path: str, out_path: str, N: int, e: int, workers: int | None = None) -> None:
+    """
+    Encrypt a file block by block (textbook RSA, no padding).
+    The input is memory-mapped and blocks are converted in parallel
+    when workers > 1, with the output written in order.
+    """
+    plain, cipher = block_sizes(N)
+    size: int = os.path.getsize(in_path)
+
+    with open(out_path, 'wb') as out:
+        out.write(size.to_bytes(FILE_HEADER_SIZE, 'big'))
+        if size:
+            crypt_file(in_path, out, 0, size, plain, cipher, cipher,
+                       partial(encrypt, N=N, e=e), workers)
+
+
+def decrypt_file(in_path: str, out_path: str, N: int, d: int, private_key: PrivateKey | None = None,
+                 workers: int | None = None) -> None:
+    """
+    Decrypt a file written by encrypt_file, using CRT when private_key is given.
+    """
+    plain, cipher = block_sizes(N)
+    data_size: int = os.path.getsize(in_path) - FILE_HEADER_SIZE
+
+    with open(in_path, 'rb') as f:
+        length: int = int.from_bytes(f.read(FILE_HEADER_SIZE), 'big')
+    n_blocks: int = -(-length // plain)
+    if data_size != n_blocks * cipher:
+        raise ValueError(f"{in_path} is not a file encrypted with this key size")
+
+    with open(out_path, 'wb') as out:
+        if length:
+            out_last: int = length - (n_blocks - 1) * plain
+            crypt_file(in_path, out, FILE_HEADER_SIZE, data_size, cipher, plain, out_last,
+                       partial(decrypt, N=N, d=d, private_key=private_key), workers)
+
+
+class PrimeFactory:
+    """
+    Keeps a bounded queue of ready primes per bit size, refilled in the
+    background by a process pool, so a key request only costs the final
+    multiplication and inverse.
+
+        with PrimeFactory([1024, 2048], capacity=8) as factory:
+            N, e, d = factory.generate_key_pairs(2048)
+    """
+
+    def __init__(self, bit_sizes: list[int] = (), capacity: int = 4, workers: int | None = None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity: int = capacity
+        self.executor = ProcessPoolExecutor(workers)
+        self.ready: dict[int, queue.Queue] = {}
+        self.pending: dict[int, int] = {}
+        self.lock = threading.Lock()
+        self.closed: bool = False
+
+        for bits in bit_sizes:
+            self.refill(bits)
+
+    def refill(self, bits: int) -> None:
+        # Keep (ready + in flight) at capacity for this bit size
+        check_prime_bits(bits)
+        futures: list[Future] = []
+        with self.lock:
+            if self.closed:
+                return
+            if bits not in self.ready:
+                self.ready[bits] = queue.Queue(self.capacity)
+                self.pending[bits] = 0
+            while self.ready[bits].qsize() + self.pending[bits] < self.capacity:
+                futures.append(self.executor.submit(seeded_prime, bits, random.getrandbits(64)))
+                self.pending[bits] += 1
+        # A finished future runs its callback right away, and on_prime takes the lock
+        for future in futures:
+            future.add_done_callback(partial(self.on_prime, bits))
+
+    def on_prime(self, bits: int, future: Future) -> None:
+        with self.lock:
+            self.pending[bits] -= 1
+        if future.cancelled():
+            return
+        # A failure is queued like a prime, so get_prime raises it instead of waiting forever
+        try:
+            self.ready[bits].put_nowait(future.exception() or future.result())
+        except queue.Full:
+            pass
+
+    def get_prime(self, bits: int, timeout: float | None = None) -> int:
+        """
+        Take a ready prime of `bits` bits, waiting for one if the queue is empty.
+        Raises queue.Empty if timeout runs out first, or the error of a failed search.
+        """
+        if self.closed:
+            raise RuntimeError("PrimeFactory is closed")
+        self.refill(bits)
+        prime: int | Exception = self.ready[bits].get(timeout=timeout)
+        if isinstance(prime, Exception):
+            raise prime
+        self.refill(bits)
+        return prime
+
+    def generate_key_pairs(self, bits: int, extended: bool = False) -> tuple:
+        # Two distinct primes of `bits` bits, so the same minimum size as generate_key_pairs
+        check_key_prime_bits(bits)
+        p: int = self.get_prime(bits)
+        q: int = self.get_prime(bits)
+        while q == p:
+            q = self.get_prime(bits)
+        return keys_from_primes(p, q, extended)
+
+    def close(self) -> None:
+        with self.lock:
+            self.closed = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,6 +1,13 @@
+import multiprocessing
+import queue
 import random
+from concurrent.futures import Future
+
+import pytest
 from byu_pytest_utils import max_score
-from rsa import generate_key_pairs
+from rsa import generate_key_pairs, generate_large_prime, PrimeFactory, encrypt, decrypt, prime_worker
+from rsa import ext_euclid, batch_mod_inverse, encrypt_file, decrypt_file
+from fermat import miller_rabin
 from fermat import mod_exp
 
 
@@ -31,3 +38,145 @@ def test_key_pair_encoding_decoding():
 @max_score(20)
 def test_generate_key_pair():
     N, d, e = generate_key_pairs(32)
+
+
+def test_generate_large_prime_bit_length():
+    for test in ["baillie_psw", "miller_rabin"]:
+        for bits in [2, 3, 8, 17, 64, 256]:
+            for _ in range(5):
+                p = generate_large_prime(bits, test=test)
+                assert p.bit_length() == bits
+                assert miller_rabin(p, 20) == "prime"
+
+
+def test_generate_key_pairs_parallel():
+    N, e, d = generate_key_pairs(128, workers=2)
+    message = random.getrandbits(64)
+    assert mod_exp(mod_exp(message, e, N), d, N) == message
+
+
+def test_prime_factory():
+    with PrimeFactory([64], capacity=2, workers=2) as factory:
+        for bits in [64, 96]:
+            N, e, d = factory.generate_key_pairs(bits)
+            assert N.bit_length() in (2 * bits - 1, 2 * bits)
+            message = random.getrandbits(32)
+            assert mod_exp(mod_exp(message, e, N), d, N) == message
+
+
+def test_prime_search_errors_reach_the_caller():
+    with pytest.raises(ValueError):
+        generate_key_pairs(1, workers=2)
+
+    # A failing worker hands its error to the parent instead of leaving it waiting
+    stop = multiprocessing.Event()
+    results = multiprocessing.Queue()
+    prime_worker(1, 312, stop, results)
+    assert isinstance(results.get(timeout=5), ValueError)
+
+    with PrimeFactory(capacity=1, workers=1) as factory:
+        with pytest.raises(ValueError):
+            factory.get_prime(1)
+        failed = Future()
+        failed.set_exception(RuntimeError("worker failed"))
+        factory.ready[64] = queue.Queue(1)
+        factory.pending[64] = 1
+        factory.on_prime(64, failed)
+        with pytest.raises(RuntimeError):
+            factory.get_prime(64)
+
+
+def test_prime_factory_finished_futures():
+    class InlineExecutor:
+        # Hands back futures that are already done, like a pool that answers instantly
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+        def shutdown(self, **kwargs):
+            pass
+
+    with PrimeFactory(capacity=2, workers=1) as factory:
+        factory.executor.shutdown()
+        factory.executor = InlineExecutor()
+        assert factory.get_prime(16, timeout=5).bit_length() == 16
+        # 3 is the only odd 2-bit prime, so no key can be built from two of them
+        with pytest.raises(ValueError):
+            factory.generate_key_pairs(2)
+
+
+def test_crt_decrypt():
+    for bits in [32, 128, 512]:
+        N, e, d, private_key = generate_key_pairs(bits, extended=True)
+        assert private_key.p * private_key.q == N
+        for _ in range(10):
+            message = random.randrange(N)
+            ciphertext = encrypt(message, N, e)
+            assert decrypt(ciphertext, N, d) == message
+            assert decrypt(ciphertext, N, d, private_key) == message
+
+
+def test_ext_euclid_iterative():
+    for bits in [8, 64, 200, 2048, 4096]:
+        for _ in range(20):
+            a = random.getrandbits(bits)
+            b = random.getrandbits(bits // 2 + 1)
+            for x_arg, y_arg in [(a, b), (b, a)]:
+                x, y, d = ext_euclid(x_arg, y_arg)
+                assert x_arg * x + y_arg * y == d
+                assert x_arg % d == 0 and y_arg % d == 0
+
+
+def test_batch_mod_inverse():
+    m = (1 << 127) - 1
+    values = [random.randrange(1, m) for _ in range(200)]
+    for v, inv in zip(values, batch_mod_inverse(values, m)):
+        assert v * inv % m == 1
+    assert batch_mod_inverse([], m) == []
+
+
+def test_encrypt_file_round_trip(tmp_path):
+    N, e, d, private_key = generate_key_pairs(64, extended=True)
+    plain_path = tmp_path / 'plain.bin'
+    cipher_path = tmp_path / 'cipher.bin'
+    out_path = tmp_path / 'out.bin'
+
+    for data in [b'', b'\x00', b'\x00\x00hello rsa', random.randbytes(5000)]:
+        plain_path.write_bytes(data)
+        for workers in [None, 2]:
+            encrypt_file(plain_path, cipher_path, N, e, workers=workers)
+            decrypt_file(cipher_path, out_path, N, d, private_key, workers=workers)
+            assert out_path.read_bytes() == data
+
+
+def test_multi_prime_keys():
+    for primes in [3, 4]:
+        for bits in [64, 256]:
+            N, e, d, private_key = generate_key_pairs(bits, extended=True, primes=primes)
+            assert len(private_key.others) == primes - 2
+            for _ in range(10):
+                message = random.randrange(N)
+                ciphertext = encrypt(message, N, e)
+                assert decrypt(ciphertext, N, d) == message
+                assert decrypt(ciphertext, N, d, private_key) == message
+
+    # Too few distinct 4-bit primes for four factors, or 2-bit primes for two
+    with pytest.raises(ValueError):
+        generate_key_pairs(8, primes=4)
+    for workers in [None, 2]:
+        with pytest.raises(ValueError):
+            generate_key_pairs(2, workers=workers)
+    N, e, d = generate_key_pairs(3)
+    assert mod_exp(mod_exp(2, e, N), d, N) == 2
+    N, e, d = generate_key_pairs(16, primes=4)
+    assert mod_exp(mod_exp(5, e, N), d, N) == 5
+
+
+def test_generate_safe_prime():
+    for bits in [3, 4, 16, 64, 128]:
+        for _ in range(3):
+            p = generate_large_prime(bits, safe=True)
+            assert p.bit_length() == bits
+            assert miller_rabin(p, 20) == "prime"
+            assert miller_rabin((p - 1) // 2, 20) == "prime"
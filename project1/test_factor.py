@@ -0,0 +1,30 @@
+import math
+
+from factor import factor, brent_rho
+from fermat import miller_rabin
+
+
+def test_factor_small_numbers():
+    for N in range(1, 3000):
+        factors = factor(N)
+        assert math.prod(factors) == N
+        assert all(miller_rabin(p, 20, deterministic=True) == "prime" for p in factors)
+
+
+def test_factor_composites():
+    cases = {
+        409359300583028201801840123: (7, 113, 3511, 147399954336408564523),
+        1000000016000000063: (1000000007, 1000000009),
+        2 ** 10 * 32771 ** 2: (2,) * 10 + (32771, 32771),
+        7520681183 * 7263570389: (7263570389, 7520681183),
+        (2 ** 61 - 1) ** 3: (2 ** 61 - 1,) * 3,
+        (1000000007 * 1000000009) ** 5 * 3: (3,) + (1000000007,) * 5 + (1000000009,) * 5,
+    }
+    for N, expected in cases.items():
+        assert factor(N) == expected
+
+
+def test_brent_rho_finds_a_divisor():
+    N = 4505853973 * 3176051033
+    d = brent_rho(N)
+    assert 1 < d < N and N % d == 0
@@ -1,7 +1,8 @@
 import pytest
 from byu_pytest_utils import max_score
 
-from fermat import mod_exp, fermat, miller_rabin
+from fermat import mod_exp, mod_exp_many, fermat, miller_rabin, baillie_psw, MOD_EXP_METHODS
+from fermat import small_primes, primes_in_range, is_prime_bulk
 
 mod_exp_args = [
     (2, 10, 17, 4),
@@ -19,6 +20,18 @@ def test_mod_exp() -> None:
         assert mod_exp(x, y, N) == expected
 
 
+def test_mod_exp_methods() -> None:
+    for method in MOD_EXP_METHODS:
+        for x, y, N, expected in mod_exp_args:
+            assert mod_exp(x, y, N, method=method) == expected
+
+    # Large exponents would overflow the old recursive version's stack
+    N = (1 << 2047) + 1155
+    for method in MOD_EXP_METHODS:
+        assert mod_exp(3, N - 2, N, method=method) == pow(3, N - 2, N)
+        assert mod_exp(7, 0, N, method=method) == 1
+
+
 prime_args = [17, 7520681183, 7263570389, 8993337217, 1320230501, 4955627707, 1095542699, 4505853973, 3176051033,
               6620550763, 2175869827, 565873182758780452445419697353, 529711114181889655730813410547,
               600873118804270914899076141007, 414831830449457057686418708951, 307982960434844707438032183853]
@@ -62,3 +75,54 @@ def test_composites_miller_rabin() -> None:
     for N in composite_args:
         call = miller_rabin(N, 100)
         assert call == "composite"
+
+
+strong_pseudoprimes = [2047, 1373653, 25326001, 3215031751, 2152302898747, 3474749660383,
+                       341550071728321, 3825123056546413051, 318665857834031151167461]
+
+
+def test_miller_rabin_deterministic() -> None:
+    for N in prime_args:
+        assert miller_rabin(N, 0, deterministic=True) == "prime"
+    for N in composite_args + strong_pseudoprimes:
+        assert miller_rabin(N, 20, deterministic=True) == "composite"
+
+
+def test_mod_exp_many() -> None:
+    N = prime_args[-1]
+    bases = [2, 3, 5, N - 1, N + 7]
+    for method in MOD_EXP_METHODS:
+        assert mod_exp_many(bases, N - 1, N, method) == [pow(a, N - 1, N) for a in bases]
+        assert mod_exp_many([], N - 1, N, method) == []
+        assert fermat(N, 20, method) == "prime"
+        assert miller_rabin(N, 20, method=method) == "prime"
+        assert miller_rabin(composite_args[-1], 20, method=method) == "composite"
+
+
+strong_lucas_pseudoprimes = [5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519]
+
+
+def test_baillie_psw() -> None:
+    for N in prime_args + [2, 3, 5, 229]:
+        assert baillie_psw(N) == "prime"
+    for N in composite_args + strong_pseudoprimes + strong_lucas_pseudoprimes + [0, 1, 229 ** 2]:
+        assert baillie_psw(N) == "composite"
+
+
+def test_primes_in_range() -> None:
+    expected = small_primes(300000)
+    assert list(primes_in_range(0, 300000)) == expected
+    for lo, hi in [(0, 2), (2, 3), (3, 8), (8, 11), (131000, 140000), (299000, 300000)]:
+        assert list(primes_in_range(lo, hi)) == [p for p in expected if lo <= p < hi]
+
+    # Far above the small-prime table, checked against deterministic Miller-Rabin
+    lo = 10 ** 10
+    found = set(primes_in_range(lo, lo + 5000))
+    for N in range(lo, lo + 5000):
+        assert (N in found) == (miller_rabin(N, 0, deterministic=True) == "prime")
+
+
+def test_is_prime_bulk() -> None:
+    values = list(range(-2, 20000)) + prime_args + composite_args + list(range(10 ** 12, 10 ** 12 + 20000))
+    expected = [miller_rabin(N, 20, deterministic=True) == "prime" for N in values]
+    assert is_prime_bulk(values) == expected
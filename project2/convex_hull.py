@@ -1,7 +1,13 @@
-# Uncomment this line to import some functions that can help
-# you debug your algorithm
-import matplotlib.pyplot as plt
-from plotting import draw_line, draw_hull, circle_point
+import bisect
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# This module never imports matplotlib, so computing a hull has no plotting
+# side effects. To debug visually, use compute_hull_debug or run main.py --debug,
+# and import draw_line/circle_point from plotting where you need them.
 
 def find_average_x(points: list[tuple[float, float]]) -> float:
     average_x = 0.0
@@ -22,12 +28,12 @@ def split_into_left_right(points: list[tuple[float, float]], left: list[tuple[fl
         
     return (left, right)
 
-def find_extreme_point(points: list[tuple[float, float]], find_right_most: bool) -> tuple[float, float]:
+def find_extreme_point(points: list[tuple[float, float]], find_right_most: bool) -> int:
     
     if find_right_most:
-        return max(points, key=lambda p: p[0])
+        return max(range(len(points)), key=lambda i: points[i][0])
     else:
-        return min(points, key=lambda p: p[0])
+        return min(range(len(points)), key=lambda i: points[i][0])
 
 def calculate_slope(left_point: tuple[float,float], right_point: tuple[float,float]) -> float:
     return (right_point[1] - left_point[1])/ (right_point[0] - left_point[0])
@@ -38,21 +44,27 @@ def is_bigger_tangent_line(temp: float, curr_slope: float) -> bool:
 def is_smaller_tangent_line(temp: float, curr_slope: float) -> bool:
     return temp > curr_slope 
 
-def find_neighbor(points: list[tuple[float, float]], current_point: tuple[float, float],
-                   isClockwise: bool) -> tuple[float, float]:
-    idx = points.index(current_point)
+def find_neighbor(points: list[tuple[float, float]], current_idx: int,
+                   isClockwise: bool) -> int:
+    # Hulls are stored counterclockwise, so a neighbor is just the next or previous index
     if isClockwise:
-        return points[(idx - 1) % len(points)]
+        return (current_idx - 1) % len(points)
     else:
-        return points[(idx + 1) % len(points)]
+        return (current_idx + 1) % len(points)
 
 def find_upper_Tangent(left: list[tuple[float, float]], 
-                       right: list[tuple[float, float]]) -> tuple[tuple[float, float], tuple[float, float]]:
-    
-    p: tuple[float, float] = find_extreme_point(left, True)
-    q: tuple[float, float] = find_extreme_point(right, False)
-
-    temp: float = calculate_slope(p, q)
+                       right: list[tuple[float, float]],
+                       left_start: int | None = None,
+                       right_start: int | None = None) -> tuple[int, int]:
+    """
+    Returns the indices (in left, in right) of the upper tangent's endpoints.
+    The search starts at the rightmost point of left and the leftmost point
+    of right; pass their indices if they are already known to skip the scan.
+    """
+    p: int = find_extreme_point(left, True) if left_start is None else left_start
+    q: int = find_extreme_point(right, False) if right_start is None else right_start
+
+    temp: float = calculate_slope(left[p], right[q])
     done: bool = False
 
     if len(left) == 1 and len(right) == 1:
@@ -67,7 +79,7 @@ def find_upper_Tangent(left: list[tuple[float, float]],
             if r == p:
                 break  
             prev_slope = temp
-            curr_slope = calculate_slope(r, q)
+            curr_slope = calculate_slope(left[r], right[q])
 
             if is_smaller_tangent_line(prev_slope, curr_slope):  
                 temp = curr_slope
@@ -82,7 +94,7 @@ def find_upper_Tangent(left: list[tuple[float, float]],
             if v == q:
                 break  
             prev_slope = temp
-            curr_slope = calculate_slope(v, p)
+            curr_slope = calculate_slope(right[v], left[p])
 
             if is_bigger_tangent_line(prev_slope, curr_slope):
                 temp = curr_slope
@@ -95,11 +107,15 @@ def find_upper_Tangent(left: list[tuple[float, float]],
 
 
 def find_Lower_Tangent(left: list[tuple[float, float]], 
-                       right: list[tuple[float, float]]) -> tuple[tuple[float, float], tuple[float, float]]:
-
-    p: tuple[float, float] = find_extreme_point(left, True)  
-    q: tuple[float, float] = find_extreme_point(right, False)  
-    temp: float = calculate_slope(p, q)
+                       right: list[tuple[float, float]],
+                       left_start: int | None = None,
+                       right_start: int | None = None) -> tuple[int, int]:
+    """
+    Returns the indices (in left, in right) of the lower tangent's endpoints.
+    """
+    p: int = find_extreme_point(left, True) if left_start is None else left_start
+    q: int = find_extreme_point(right, False) if right_start is None else right_start
+    temp: float = calculate_slope(left[p], right[q])
     done: bool = False
 
     while not done:
@@ -111,7 +127,7 @@ def find_Lower_Tangent(left: list[tuple[float, float]],
             if r == p:
                 break  
             prev_slope = temp
-            curr_slope = calculate_slope(r, q)
+            curr_slope = calculate_slope(left[r], right[q])
 
             if is_bigger_tangent_line(prev_slope, curr_slope):  
                 temp = curr_slope
@@ -126,7 +142,7 @@ def find_Lower_Tangent(left: list[tuple[float, float]],
             if v == q:
                 break  
             prev_slope = temp
-            curr_slope = calculate_slope(v, p)
+            curr_slope = calculate_slope(right[v], left[p])
 
             if is_smaller_tangent_line(prev_slope, curr_slope):  
                 temp = curr_slope
@@ -138,51 +154,37 @@ def find_Lower_Tangent(left: list[tuple[float, float]],
     return (p, q)
 
     
-def combine(upper:list[tuple], lower:list[tuple], left:list[tuple[float, float]], 
+def combine(upper:tuple[int, int], lower:tuple[int, int], left:list[tuple[float, float]], 
             right:list[tuple[float, float]])-> list[tuple[float, float]]:
+    """
+    Merge two counterclockwise hulls given the tangent indices.
+    left must start at its leftmost point; so does the merged hull:
+    left's lower chain up to the lower tangent, right from the lower tangent
+    around to the upper tangent, then left from the upper tangent back to the start.
+    """
     
-    combined_hull: list[tuple[float,float]] = []
-
-    right_start = right.index(lower[1])
-    right_stop = right.index(upper[1])
-
-    left_start = left.index(upper[0])
-    left_stop = left.index(lower[0])
-
-
-
-    if len(right) == 1:
-        combined_hull.append(right[0])
-    else:
-        current_idx = right_start
-        while True:
-    
-            combined_hull.append(right[current_idx])
+    combined_hull: list[tuple[float,float]] = left[:lower[0] + 1]
 
-            if right[current_idx] == right[right_stop]:
-                break
+    current_idx = lower[1]
+    while True:
+        combined_hull.append(right[current_idx])
+        if current_idx == upper[1]:
+            break
+        current_idx = (current_idx + 1) % len(right)
 
-            current_idx = (current_idx + 1) % len(right)
-
-    if len(left) == 1:
-        combined_hull.append(left[0])
-    else:
-        current_idx = left_start
-        while True:
-    
-            combined_hull.append(left[current_idx])
-
-            if left[current_idx] == left[left_stop]:
-                break
-
-            current_idx = (current_idx + 1) % len(left)
+    if upper[0] != 0:
+        combined_hull.extend(left[upper[0]:])
 
     return combined_hull
 
-def compute_hull_helper(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+def compute_hull_helper(points: list[tuple[float, float]]) -> tuple[list[tuple[float, float]], int]:
+    """
+    Hull of x-sorted points, counterclockwise from the leftmost point,
+    along with the index of its rightmost point.
+    """
     theta = 2 #threshold value
     if len(points) <= theta:
-        return points
+        return points, len(points) - 1
 
     average_x = find_average_x(points)
     
@@ -191,25 +193,586 @@ def compute_hull_helper(points: list[tuple[float, float]]) -> list[tuple[float,
 
     left, right = split_into_left_right(points, left, right, average_x)
 
-    left_hull:list[tuple[float, float]] = compute_hull_helper(left)
-    right_hull:list[tuple[float, float]] = compute_hull_helper(right)
+    left_hull, left_rightmost = compute_hull_helper(left)
+    right_hull, right_rightmost = compute_hull_helper(right)
 
-    upper:list[tuple] = list(find_upper_Tangent(left_hull, right_hull))
-    lower:list[tuple] = list(find_Lower_Tangent(left_hull, right_hull))
+    return merge_hulls(left_hull, left_rightmost, right_hull, right_rightmost)
 
-    convex_hull:list[tuple[float, float]] = combine(upper, lower, left_hull, right_hull)
 
-    return convex_hull
+def merge_hulls(left_hull: list[tuple[float, float]], left_rightmost: int,
+                right_hull: list[tuple[float, float]],
+                right_rightmost: int) -> tuple[list[tuple[float, float]], int]:
+    """
+    Merge two hulls that are separated in x (every point of left_hull is left
+    of every point of right_hull). Both are counterclockwise from their
+    leftmost point; returns the merged hull in the same form with its rightmost index.
+    """
+    upper = find_upper_Tangent(left_hull, right_hull, left_rightmost, 0)
+    lower = find_Lower_Tangent(left_hull, right_hull, left_rightmost, 0)
 
+    convex_hull:list[tuple[float, float]] = combine(upper, lower, left_hull, right_hull)
 
+    # The right hull's rightmost point lands after left[:lower+1] and the walk from lower[1]
+    rightmost = lower[0] + 1 + (right_rightmost - lower[1]) % len(right_hull)
+
+    return convex_hull, rightmost
+
+
+# Each parallel strip gets at least this many points
+MIN_STRIP_POINTS = 1000
+
+
+def strip_hull(shm_name: str, start: int, stop: int) -> tuple[list[tuple[float, float]], int]:
+    """
+    Pool worker: hull of points[start:stop] read from the shared x,y buffer.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        coords = shm.buf.cast('d')
+        flat = coords[2 * start:2 * stop].tolist()
+        coords.release()
+    finally:
+        shm.close()
+    points = list(zip(flat[0::2], flat[1::2]))
+    return compute_hull_helper(points)
+
+
+def split_into_strips(points: list[tuple[float, float]], strips: int) -> list[tuple[int, int]]:
+    # Contiguous ranges of the x-sorted points, never splitting points that share an x
+    bounds = [0]
+    for k in range(1, strips):
+        cut = max(k * len(points) // strips, bounds[-1] + 1)
+        while cut < len(points) and points[cut][0] == points[cut - 1][0]:
+            cut += 1
+        if cut < len(points):
+            bounds.append(cut)
+    bounds.append(len(points))
+    return list(zip(bounds, bounds[1:]))
+
+
+def compute_hull_parallel(points: list[tuple[float, float]], workers: int) -> list[tuple[float, float]]:
+    """
+    Hull of x-sorted points: the strip hulls are computed in a process pool,
+    then merged pairwise with merge_hulls. Coordinates reach the workers
+    through one shared-memory buffer instead of pickled lists.
+    """
+    ranges = split_into_strips(points, min(workers, len(points) // MIN_STRIP_POINTS))
+    flat = array('d', [c for point in points for c in point])
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, len(flat) * flat.itemsize))
+    try:
+        shm.buf[:len(flat) * flat.itemsize] = flat.tobytes()
+        with ProcessPoolExecutor(workers) as executor:
+            hulls = list(executor.map(strip_hull, [shm.name] * len(ranges),
+                                      *zip(*ranges)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    while len(hulls) > 1:
+        merged = [merge_hulls(*hulls[i], *hulls[i + 1]) for i in range(0, len(hulls) - 1, 2)]
+        if len(hulls) % 2:
+            merged.append(hulls[-1])
+        hulls = merged
+
+    return hulls[0][0]
+
+
+HULL_METHODS = ("divide", "chan")
+
+# Chan's method starts with groups of this size and squares it after each failed round
+CHAN_START_GROUP = 16
+
+
+def top_per_x(chain: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    # Keep only the highest point at each x (vertical hull edges sit at the chain ends)
+    kept: list[tuple[float, float]] = []
+    for point in chain:
+        if kept and kept[-1][0] == point[0]:
+            if point[1] > kept[-1][1]:
+                kept[-1] = point
+        else:
+            kept.append(point)
+    return kept
+
+
+def group_chains(hull: list[tuple[float, float]],
+                 rightmost: int) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+    """
+    Split a counterclockwise group hull into its upper chain and its lower
+    chain with y flipped. Both are concave and strictly increasing in x,
+    so one wrapping routine serves both.
+    """
+    upper = (hull[rightmost:] + hull[:1])[::-1]
+    lower = [(x, -y) for x, y in hull[:rightmost + 1]]
+    return top_per_x(upper), top_per_x(lower)
+
+
+def chain_tangent(chain: list[tuple[float, float]], px: float, py: float) -> int | None:
+    """
+    Index of the vertex right of p that p sees at the steepest slope, or None
+    if no vertex of the chain is right of p. Along a concave chain the slope
+    from p rises and then falls, so the peak is found by binary search.
+    """
+    lo = bisect.bisect_right(chain, px, key=lambda point: point[0])
+    if lo == len(chain):
+        return None
+    hi = len(chain) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        (ax, ay), (bx, by) = chain[mid], chain[mid + 1]
+        if turn(px, py, ax, ay, bx, by) >= 0:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def wrap_chain(chains: list[list[tuple[float, float]]], start: tuple[float, float],
+               limit: int) -> list[tuple[float, float]] | None:
+    """
+    Gift-wrap one hull chain from start to the right: each step takes the
+    steepest of the groups' tangent points (the farthest one on ties).
+    Returns None once the chain would need more than limit edges.
+    """
+    chain = [start]
+    px, py = start
+    while len(chain) <= limit:
+        best: tuple[float, float] | None = None
+        for group in chains:
+            i = chain_tangent(group, px, py)
+            if i is None:
+                continue
+            qx, qy = group[i]
+            if best is None:
+                best = (qx, qy)
+                continue
+            side = turn(px, py, best[0], best[1], qx, qy)
+            if side > 0 or (side == 0 and qx > best[0]):
+                best = (qx, qy)
+        if best is None:
+            return chain
+        chain.append(best)
+        px, py = best
+    return None
+
+
+def compute_hull_chan(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Chan's output-sensitive hull in O(n log h).
+
+    The points are cut into groups of m, each hulled with compute_hull_helper,
+    and the upper and lower chains are then gift-wrapped across the groups
+    with a binary-searched tangent per group. Wrapping gives up after m edges,
+    in which case m is squared and the round is repeated, so the total work
+    stays O(n log h). A bigger group is hulled from the vertices of the
+    smaller group hulls it covers, so only the first round reads every point.
+    """
+    if not points:
+        return []
+
+    upper_start = min(points, key=lambda point: (point[0], -point[1]))
+    lower_start = min(points)
+    m = min(CHAN_START_GROUP, len(points))
+    groups = [compute_hull_helper(sorted(points[i:i + m])) for i in range(0, len(points), m)]
+    while True:
+        chains = [group_chains(*group) for group in groups]
+        upper = wrap_chain([c[0] for c in chains], upper_start, m)
+        if upper is not None:
+            lower = wrap_chain([c[1] for c in chains], (lower_start[0], -lower_start[1]), m)
+            if lower is not None:
+                break
 
+        # Square the group size: every new group absorbs m of the current ones
+        groups = [compute_hull_helper(sorted(p for hull, _ in groups[i:i + m] for p in hull))
+                  for i in range(0, len(groups), m)]
+        m = min(m * m, len(points))
+
+    # Counterclockwise from the leftmost point: the lower chain, then back along the upper
+    hull = [(x, -y) for x, y in lower]
+    back = upper[::-1]
+    if back[0] == hull[-1]:
+        back = back[1:]
+    if back and back[-1] == hull[0]:
+        back = back[:-1]
+    return hull + back
+
+
+def compute_hull(points: list[tuple[float, float]], prefilter: bool = False,
+                 workers: int | None = None, method: str = "divide") -> list[tuple[float, float]]:
+    """
+    method="divide" is the divide-and-conquer hull; method="chan" is Chan's
+    output-sensitive O(n log h) hull, which pays off when the hull is tiny
+    next to the input (it ignores workers).
+    With prefilter=True, the Akl-Toussaint octagon test (see convex_hull_np)
+    drops the clearly interior points first and only the survivors are hulled.
+    With workers > 1, the x-sorted points are cut into that many strips
+    (of at least MIN_STRIP_POINTS each) that are hulled in parallel.
+    """
+    if prefilter and len(points) > 2:
+        # NumPy is only needed for the prefilter, so it is imported on demand
+        from convex_hull_np import akl_toussaint_filter
+        points = [points[i] for i in akl_toussaint_filter(points).tolist()]
+
+    if method not in HULL_METHODS:
+        raise ValueError(f"Unknown hull method: {method}")
+    if method == "chan":
+        return compute_hull_chan(points)
 
-def compute_hull(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
     points.sort(key=lambda point: point[0])
 
-    convex_hull = compute_hull_helper(points)
+    if workers is not None and workers > 1 and len(points) >= 2 * MIN_STRIP_POINTS:
+        return compute_hull_parallel(points, workers)
 
+    convex_hull, _ = compute_hull_helper(points)
+
+    return convex_hull
+
+
+def turn(ox: float, oy: float, ax: float, ay: float, bx: float, by: float) -> float:
+    """ Cross product of OA and OB; >= 0 means O -> A -> B is not a right turn. """
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+class HullChain:
+    """
+    One monotone chain of an incremental hull, kept sorted by x.
+    sign=1 keeps the upper chain; sign=-1 keeps the lower chain by storing
+    every point with y flipped, so both chains share the same logic.
+    """
+
+    def __init__(self, sign: int):
+        self.sign = sign
+        self.xs: list[float] = []
+        self.ys: list[float] = []
+
+    def add(self, x: float, y: float) -> bool:
+        """
+        Add a point, returning False if it is on or under the chain.
+        The position is found by bisection; the neighbors that stop being
+        convex are deleted, and each point can only be deleted once.
+        """
+        y *= self.sign
+        xs, ys = self.xs, self.ys
+        i = bisect.bisect_left(xs, x)
+
+        if i < len(xs) and xs[i] == x:
+            if ys[i] >= y:
+                return False
+            del xs[i], ys[i]
+        elif 0 < i < len(xs) and turn(xs[i - 1], ys[i - 1], x, y, xs[i], ys[i]) >= 0:
+            return False
+
+        xs.insert(i, x)
+        ys.insert(i, y)
+
+        # Drop left neighbors that no longer make a right turn
+        j = i
+        while j >= 2 and turn(xs[j - 2], ys[j - 2], xs[j - 1], ys[j - 1], x, y) >= 0:
+            j -= 1
+        del xs[j:i], ys[j:i]
+        i = j
+
+        # ... and the same on the right
+        k = i
+        while k + 2 < len(xs) and turn(x, y, xs[k + 1], ys[k + 1], xs[k + 2], ys[k + 2]) >= 0:
+            k += 1
+        del xs[i + 1:k + 1], ys[i + 1:k + 1]
+        return True
+
+    def points(self) -> list[tuple[float, float]]:
+        return [(x, y * self.sign) for x, y in zip(self.xs, self.ys)]
+
+
+class IncrementalHull:
+    """
+    Convex hull of a growing point stream.
+
+    The upper and lower chains are sorted by x, so each insertion finds its
+    place by binary search (O(log h)) and only touches the hull vertices it
+    removes, which is amortized O(1) per point. Only hull vertices are kept,
+    never the input history. (Chain updates are list inserts/deletes, a
+    memmove that is small next to the Python work for realistic h.)
+
+        stream = IncrementalHull()
+        stream.add_many(batch)
+        hull = stream.hull()
+    """
+
+    def __init__(self, points: list[tuple[float, float]] = ()):
+        self.upper = HullChain(1)
+        self.lower = HullChain(-1)
+        self.add_many(points)
+
+    def add(self, point: tuple[float, float]) -> bool:
+        """ Add one point; returns True if it changed the hull. """
+        x, y = point
+        changed_upper = self.upper.add(x, y)
+        changed_lower = self.lower.add(x, y)
+        return changed_upper or changed_lower
+
+    def add_many(self, points: list[tuple[float, float]]) -> int:
+        """ Add a batch of points; returns how many of them changed the hull. """
+        return sum(self.add(point) for point in points)
+
+    def hull(self) -> list[tuple[float, float]]:
+        """ The current hull, counterclockwise from the leftmost point, in O(h). """
+        lower = self.lower.points()
+        upper = self.upper.points()
+        if not lower:
+            return []
+
+        # Walk back along the upper chain, skipping endpoints the lower chain already has
+        back = upper[::-1]
+        if back[0] == lower[-1]:
+            back = back[1:]
+        if back and back[-1] == lower[0]:
+            back = back[:-1]
+        return lower + back
+
+    def __len__(self) -> int:
+        return len(self.hull())
+
+
+class HullBucket:
+    """
+    A batch of consecutive points of a DynamicHull with their timestamps.
+    The bucket's hull is cached in an IncrementalHull, which keeps absorbing
+    insertions and is thrown away (rebuilt on demand) after a deletion.
+    slot is the bucket's leaf in the DynamicHull's tree.
+    """
+
+    def __init__(self, slot: int):
+        self.slot = slot
+        self.points: list[tuple[float, float]] = []
+        self.stamps: list[float] = []
+        self.cached: IncrementalHull | None = IncrementalHull()
+
+    def add(self, point: tuple[float, float], stamp: float):
+        self.points.append(point)
+        self.stamps.append(stamp)
+        if self.cached is not None:
+            self.cached.add(point)
+
+    def remove(self, point: tuple[float, float]):
+        i = self.points.index(point)
+        del self.points[i], self.stamps[i]
+        self.cached = None
+
+    def expire(self, cutoff: float) -> list[tuple[float, float]]:
+        # Drop and return the points stamped before cutoff (stamps are in order)
+        k = bisect.bisect_left(self.stamps, cutoff)
+        expired = self.points[:k]
+        if k:
+            del self.points[:k], self.stamps[:k]
+            self.cached = None
+        return expired
+
+    def hull(self) -> list[tuple[float, float]]:
+        if self.cached is None:
+            self.cached = IncrementalHull(self.points)
+        return self.cached.hull()
+
+
+def hull_union(a: list[tuple[float, float]], b: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Hull of two hulls' vertices with Andrew's monotone chain: one sort of the
+    few vertices, then a linear scan. Same form as IncrementalHull.hull().
+    """
+    if not a:
+        return b
+    if not b:
+        return a
+    points = sorted(set(a + b))
+    if len(points) < 3:
+        return points
+
+    lower: list[tuple[float, float]] = []
+    for x, y in points:
+        while len(lower) >= 2 and turn(*lower[-2], *lower[-1], x, y) <= 0:
+            lower.pop()
+        lower.append((x, y))
+    upper: list[tuple[float, float]] = []
+    for x, y in reversed(points):
+        while len(upper) >= 2 and turn(*upper[-2], *upper[-1], x, y) <= 0:
+            upper.pop()
+        upper.append((x, y))
+    return lower[:-1] + upper[:-1]
+
+
+class DynamicHull:
+    """
+    Convex hull under insertions and deletions (bucketed variant).
+
+    Points go into buckets of bucket_size (B) consecutive insertions, each
+    with its own cached hull. The buckets are the leaves of a segment tree
+    whose nodes cache the hull of everything below them. Updates only mark
+    their bucket dirty; hull() rebuilds the dirty bucket hulls and re-merges
+    the O(log(n/B)) nodes above each one, a merge costing O(h log h) in the
+    two child hull sizes (a sort, then a linear scan). So per bucket touched, a query costs
+    - O(log(n/B) h log h) after insertions, which update the bucket hull in place,
+    - plus O(B log B) after a deletion or expiry, which rebuild it,
+    and a query with nothing changed only copies the root's hull.
+
+    With window=seconds, points stamped more than window before now are
+    expired automatically: whole buckets are dropped and at most the oldest
+    bucket is trimmed. Timestamps default to clock() and should be added in
+    non-decreasing order.
+
+        recent = DynamicHull(window=300)
+        recent.add(reading)
+        hull = recent.hull()
+    """
+
+    def __init__(self, points: list[tuple[float, float]] = (), bucket_size: int = 256,
+                 window: float | None = None, clock=time.monotonic):
+        if bucket_size < 1:
+            raise ValueError('bucket_size must be at least 1')
+        self.bucket_size = bucket_size
+        self.window = window
+        self.clock = clock
+        self.buckets: deque[HullBucket] = deque()
+        # Which buckets hold each point (a point may be added more than once)
+        self.where: dict[tuple[float, float], list[HullBucket]] = {}
+        self.size = 0
+
+        # Leaf capacity + slot holds a bucket's hull; node i merges nodes 2i and 2i+1.
+        # New buckets take slots round-robin, so expiring from the front frees them.
+        self.capacity = 1
+        self.slots: list[HullBucket | None] = [None]
+        self.tree: list[list[tuple[float, float]]] = [[], []]
+        self.cursor = 0
+        self.dirty: set[int] = set()
+        self.add_many(points)
+
+    def new_bucket(self) -> HullBucket:
+        if self.slots[self.cursor % self.capacity] is not None:
+            self.grow()
+        bucket = HullBucket(self.cursor % self.capacity)
+        self.slots[bucket.slot] = bucket
+        self.cursor += 1
+        self.buckets.append(bucket)
+        return bucket
+
+    def grow(self):
+        # Out of free slots: double the tree and renumber the buckets in order
+        while self.capacity < 2 * (len(self.buckets) + 1):
+            self.capacity *= 2
+        self.slots = [None] * self.capacity
+        self.tree = [[] for _ in range(2 * self.capacity)]
+        for slot, bucket in enumerate(self.buckets):
+            bucket.slot = slot
+            self.slots[slot] = bucket
+        self.cursor = len(self.buckets)
+        self.dirty = set(range(len(self.buckets)))
+
+    def drop(self, bucket: HullBucket):
+        self.slots[bucket.slot] = None
+        self.dirty.add(bucket.slot)
+
+    def add(self, point: tuple[float, float], timestamp: float | None = None):
+        """ Insert a point, stamped with timestamp (default: clock()). """
+        stamp = self.clock() if timestamp is None else timestamp
+        if self.window is not None:
+            self.expire(stamp)
+
+        point = tuple(point)
+        if not self.buckets or len(self.buckets[-1].points) >= self.bucket_size:
+            self.new_bucket()
+        bucket = self.buckets[-1]
+        bucket.add(point, stamp)
+        self.where.setdefault(point, []).append(bucket)
+        self.size += 1
+        self.dirty.add(bucket.slot)
+
+    def add_many(self, points: list[tuple[float, float]], timestamp: float | None = None):
+        for point in points:
+            self.add(point, timestamp)
+
+    def remove(self, point: tuple[float, float]) -> bool:
+        """ Delete one copy of point; returns False if it is not present. """
+        point = tuple(point)
+        holders = self.where.get(point)
+        if not holders:
+            return False
+
+        bucket = holders.pop()
+        if not holders:
+            del self.where[point]
+        bucket.remove(point)
+        if bucket.points:
+            self.dirty.add(bucket.slot)
+        else:
+            self.buckets.remove(bucket)
+            self.drop(bucket)
+        self.size -= 1
+        return True
+
+    def expire(self, now: float | None = None) -> int:
+        """
+        Remove the points stamped more than window before now (default: clock()).
+        Returns how many points expired; does nothing without a window.
+        """
+        if self.window is None:
+            return 0
+        cutoff = (self.clock() if now is None else now) - self.window
+
+        expired: list[tuple[tuple[float, float], HullBucket]] = []
+        while self.buckets:
+            oldest = self.buckets[0]
+            if oldest.stamps and oldest.stamps[-1] >= cutoff:
+                trimmed = oldest.expire(cutoff)
+                if trimmed:
+                    expired += [(p, oldest) for p in trimmed]
+                    self.dirty.add(oldest.slot)
+                break
+            expired += [(p, oldest) for p in oldest.points]
+            self.buckets.popleft()
+            self.drop(oldest)
+
+        for point, bucket in expired:
+            holders = self.where[point]
+            holders.remove(bucket)
+            if not holders:
+                del self.where[point]
+        self.size -= len(expired)
+        return len(expired)
+
+    def hull(self, now: float | None = None) -> list[tuple[float, float]]:
+        """ The hull of the live points, counterclockwise from the leftmost point. """
+        if self.window is not None:
+            self.expire(now)
+
+        # Rebuild the dirty leaves, then their ancestors one level at a time
+        level: set[int] = set()
+        for slot in self.dirty:
+            bucket = self.slots[slot]
+            self.tree[self.capacity + slot] = bucket.hull() if bucket is not None else []
+            level.add((self.capacity + slot) // 2)
+        self.dirty.clear()
+        level.discard(0)
+        while level:
+            for node in level:
+                self.tree[node] = hull_union(self.tree[2 * node], self.tree[2 * node + 1])
+            level = {node // 2 for node in level} - {0}
+
+        return list(self.tree[1])
+
+    def __len__(self) -> int:
+        """ Number of live points. """
+        return self.size
+
+
+def compute_hull_debug(points: list[tuple[float, float]]) -> list[tuple[float, float]]:
+    """
+    Opt-in visual path: compute the hull, then plot the points and the hull
+    and block on the plot window. matplotlib is only imported here.
+    """
+    from plotting import plot_points, draw_hull, show_plot
+
+    convex_hull = compute_hull(points)
+    plot_points(points)
     draw_hull(convex_hull)
-    plt.show()
+    show_plot()
 
     return convex_hull
\ No newline at end of file
@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from generate_np import read_points
+
+# Quickhull subproblems at or below this size are finished with a plain
+# Python monotone chain, which is cheaper than more rounds of NumPy calls
+SMALL_CHAIN: int = 256
+
+# Points per chunk that hull_from_file reads from a point file at a time
+FILE_CHUNK: int = 1 << 20
+
+
+def as_point_array(points) -> np.ndarray:
+    """
+    View points as a contiguous float64 array of shape (n, 2).
+    No copy is made if points already is one.
+    """
+    array = np.ascontiguousarray(points, dtype=np.float64)
+    if array.ndim != 2 or array.shape[1] != 2:
+        raise ValueError(f'Expected an (n, 2) array of points, got shape {array.shape}')
+    return array
+
+
+def cross(points: np.ndarray, a: int, b: int, candidates: np.ndarray) -> np.ndarray:
+    """ Cross products of AB with AP for every candidate index P, in one vectorized pass. """
+    ax, ay = points[a]
+    bx, by = points[b]
+    px = points[candidates, 0]
+    py = points[candidates, 1]
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+
+
+def monotone_chain(points: list[tuple[float, float]]) -> list[int]:
+    """
+    Andrew's monotone chain on a small list of points.
+    Returns indices into points, counterclockwise from the leftmost point.
+    """
+    order = sorted(range(len(points)), key=lambda i: points[i])
+
+    def turn(o: int, a: int, b: int) -> float:
+        (ox, oy), (ax, ay), (bx, by) = points[o], points[a], points[b]
+        return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+    lower: list[int] = []
+    for i in order:
+        while len(lower) >= 2 and turn(lower[-2], lower[-1], i) <= 0:
+            lower.pop()
+        lower.append(i)
+
+    upper: list[int] = []
+    for i in reversed(order):
+        while len(upper) >= 2 and turn(upper[-2], upper[-1], i) <= 0:
+            upper.pop()
+        upper.append(i)
+
+    return lower[:-1] + upper[:-1]
+
+
+def small_chain(points: np.ndarray, a: int, b: int, candidates: np.ndarray) -> list[int]:
+    # Hull {a, b} + candidates directly; everything lies right of a -> b,
+    # so walking the hull counterclockwise from a reaches b last
+    ids = [a, b] + candidates.tolist()
+    local = monotone_chain([tuple(p) for p in points[ids].tolist()])
+    start = local.index(0)
+    walk = local[start + 1:] + local[:start]
+    return [ids[i] for i in walk[:walk.index(1)]]
+
+
+def hull_chain(points: np.ndarray, a: int, b: int, candidates: np.ndarray) -> list[int]:
+    """
+    Quickhull over the candidates strictly to the right of the directed line a -> b.
+    Returns the hull vertices between a and b (exclusive), in order from a to b.
+    Uses an explicit stack, so deep chains (e.g. points on a circle) can't hit
+    the recursion limit.
+    """
+    chain: list[int] = []
+    # Entries are either a pending (a, b, candidates) task or a vertex to emit
+    stack: list = [(a, b, candidates)]
+
+    while stack:
+        task = stack.pop()
+        if not isinstance(task, tuple):
+            chain.append(task)
+            continue
+
+        a, b, candidates = task
+        if len(candidates) == 0:
+            continue
+        if len(candidates) <= SMALL_CHAIN:
+            chain += small_chain(points, a, b, candidates)
+            continue
+
+        # The candidate farthest from the line is a hull vertex
+        c = int(candidates[np.argmin(cross(points, a, b, candidates))])
+
+        left_part = candidates[cross(points, a, c, candidates) < 0]
+        right_part = candidates[cross(points, c, b, candidates) < 0]
+
+        # Popped in reverse: a..c first, then c, then c..b
+        stack.append((c, b, right_part))
+        stack.append(c)
+        stack.append((a, c, left_part))
+
+    return chain
+
+
+def akl_toussaint_filter(points) -> np.ndarray:
+    """
+    Indices of the points that could be on the hull (Akl-Toussaint heuristic).
+
+    The extremes of x, y, x+y and x-y are hull points; taken counterclockwise
+    they form an octagon, and anything strictly inside it is dropped in one
+    vectorized pass. Survivors keep their original order.
+    """
+    points = as_point_array(points)
+    n = len(points)
+    if n < 3:
+        return np.arange(n)
+
+    x = points[:, 0]
+    y = points[:, 1]
+    # Counterclockwise from the leftmost point: W, SW, S, SE, E, NE, N, NW
+    corners = [
+        np.argmin(x), np.argmin(x + y), np.argmin(y), np.argmax(x - y),
+        np.argmax(x), np.argmax(x + y), np.argmax(y), np.argmin(x - y),
+    ]
+    octagon: list[int] = []
+    for i in corners:
+        if not octagon or not np.array_equal(points[i], points[octagon[-1]]):
+            octagon.append(int(i))
+    while len(octagon) > 1 and np.array_equal(points[octagon[0]], points[octagon[-1]]):
+        octagon.pop()
+    if len(octagon) < 3:
+        return np.arange(n)
+
+    inside = np.ones(n, dtype=bool)
+    for a, b in zip(octagon, octagon[1:] + octagon[:1]):
+        (ax, ay), (bx, by) = points[a], points[b]
+        inside &= (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0
+
+    return np.flatnonzero(~inside)
+
+
+def compute_hull_indices(points, prefilter: bool = False) -> np.ndarray:
+    """
+    Convex hull of an (n, 2) array, as indices into that array.
+
+    The points are lexsorted once to find the leftmost and rightmost points,
+    then the lower and upper chains are built by vectorized quickhull
+    partitioning. The hull is counterclockwise from the leftmost point;
+    points lying on a hull edge are left out.
+
+    With prefilter=True, akl_toussaint_filter first discards the points
+    inside the extreme-point octagon and only the survivors are hulled.
+    """
+    points = as_point_array(points)
+    if prefilter:
+        survivors = akl_toussaint_filter(points)
+        return survivors[compute_hull_indices(points[survivors])]
+
+    n = len(points)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    left = int(order[0])
+    right = int(order[-1])
+    if np.array_equal(points[left], points[right]):
+        return np.array([left], dtype=np.intp)
+
+    everything = np.arange(n)
+    side = cross(points, left, right, everything)
+    below = everything[side < 0]
+    above = everything[side > 0]
+
+    hull = [left]
+    hull += hull_chain(points, left, right, below)
+    hull.append(right)
+    hull += hull_chain(points, right, left, above)
+
+    return np.array(hull, dtype=np.intp)
+
+
+def compute_hull_array(points, prefilter: bool = False) -> np.ndarray:
+    """ Like compute_hull_indices, but returns the hull's (h, 2) coordinates. """
+    points = as_point_array(points)
+    return points[compute_hull_indices(points, prefilter)]
+
+
+def chunk_hull(path: str, start: int, stop: int) -> np.ndarray:
+    """ Hull of rows start:stop of a memory-mapped point file. """
+    return compute_hull_array(read_points(path)[start:stop])
+
+
+def hull_from_file(path: str, chunk_size: int = FILE_CHUNK,
+                   workers: int | None = None) -> list[tuple[float, float]]:
+    """
+    Convex hull of a point file written by generate_np.write_points, without
+    loading it: the file is memory-mapped and hulled chunk_size rows at a
+    time (on a pool of workers processes if workers > 1, each mapping the
+    file itself). Every chunk hull is folded into the running hull by
+    hulling their vertices together, so memory stays at one chunk plus a
+    few hulls. The hull is counterclockwise from the leftmost point.
+    """
+    n = len(read_points(path))
+    starts = range(0, n, chunk_size)
+    stops = [min(start + chunk_size, n) for start in starts]
+
+    def fold(chunk_hulls) -> list[tuple[float, float]]:
+        hull = np.empty((0, 2), dtype=np.float64)
+        for chunk in chunk_hulls:
+            hull = compute_hull_array(np.concatenate([hull, chunk]))
+        return [tuple(p) for p in hull.tolist()]
+
+    if workers is None or workers <= 1 or len(starts) < 2:
+        return fold(map(chunk_hull, [path] * len(starts), starts, stops))
+    with ProcessPoolExecutor(workers) as executor:
+        return fold(executor.map(chunk_hull, [path] * len(starts), starts, stops))
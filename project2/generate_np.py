@@ -0,0 +1,123 @@
+import argparse
+import os
+
+import numpy as np
+
+# Points are drawn this many at a time, so huge requests never need more
+# than one block of scratch arrays on top of the output
+GENERATE_BLOCK: int = 1 << 20
+
+
+def sample_normal(rng: np.random.Generator, size: int) -> tuple[np.ndarray, np.ndarray]:
+    return rng.normal(0, 0.4, size), rng.normal(0, 0.4, size)
+
+
+def sample_uniform(rng: np.random.Generator, size: int) -> tuple[np.ndarray, np.ndarray]:
+    x, y = rng.uniform(-1, 1, (2, size))
+    return x, y
+
+
+def sample_circle(rng: np.random.Generator, size: int) -> tuple[np.ndarray, np.ndarray]:
+    # Rejection sampling on a whole block: keep the pairs that fit in the circle
+    x, y = rng.uniform(-1, 1, (2, size))
+    keep = x ** 2 + y ** 2 <= 0.98 ** 2
+    return x[keep], y[keep]
+
+
+def sample_sphere(rng: np.random.Generator, size: int) -> tuple[np.ndarray, np.ndarray]:
+    # Same acceptance test as generate_random_points; only x,y are kept
+    x, y, z = rng.uniform(-1, 1, (3, size))
+    keep = x ** 2 + y ** 2 + z <= 0.98 ** 2
+    return x[keep], y[keep]
+
+
+SAMPLERS = {
+    'normal': sample_normal,
+    'guassian': sample_normal,
+    'uniform': sample_uniform,
+    'oval': sample_circle,
+    'circular': sample_circle,
+    'circle': sample_circle,
+    'spherical': sample_sphere,
+    'sphere': sample_sphere,
+}
+
+
+def generate_point_array(distribution: str, n: int, seed: int | None = None) -> np.ndarray:
+    """
+    Vectorized counterpart of generate.generate_random_points: an (n, 2)
+    float64 array of points with unique x values, from the same distributions.
+
+    Points are drawn in blocks of up to GENERATE_BLOCK (oversampled to cover
+    rejections), then repeated x values are dropped with np.unique and the
+    gap is refilled. The same seed always gives the same array, but not the
+    same points as generate_random_points, which uses the random module.
+    """
+    distribution = distribution.lower()
+    if distribution not in SAMPLERS:
+        raise NotImplementedError(f'Random distribution of type: {distribution}')
+    sampler = SAMPLERS[distribution]
+    rng = np.random.default_rng(seed)
+
+    points = np.empty((n, 2), dtype=np.float64)
+    filled = 0
+    while True:
+        while filled < n:
+            block = min(GENERATE_BLOCK, n - filled)
+            x, y = sampler(rng, block + block // 2 + 16)
+            take = min(len(x), n - filled)
+            points[filled:filled + take, 0] = x[:take]
+            points[filled:filled + take, 1] = y[:take]
+            filled += take
+
+        # Repeats are rare, so one sort finds them and np.unique only sees those points
+        xs = np.sort(points[:, 0])
+        repeated = xs[1:][xs[1:] == xs[:-1]]
+        if len(repeated) == 0:
+            return points
+
+        # Keep the first point with each x, in the order they were drawn
+        suspects = np.flatnonzero(np.isin(points[:, 0], repeated))
+        _, first = np.unique(points[suspects, 0], return_index=True)
+        keep = np.ones(n, dtype=bool)
+        keep[np.setdiff1d(suspects, suspects[first])] = False
+        filled = int(keep.sum())
+        points[:filled] = points[keep]
+
+
+def write_points(path: str, points) -> None:
+    """
+    Save points as an .npy file, or as raw little-endian float64 x,y pairs
+    for any other extension. Either can be memory-mapped by read_points.
+    """
+    points = np.ascontiguousarray(points, dtype='<f8')
+    if path.endswith('.npy'):
+        np.save(path, points)
+    else:
+        points.tofile(path)
+
+
+def read_points(path: str, mmap: bool = True) -> np.ndarray:
+    """
+    Load an (n, 2) point array written by write_points. With mmap=True the
+    file is memory-mapped read-only, so nothing is read until it is used.
+    """
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r' if mmap else None)
+    if mmap and os.path.getsize(path) > 0:  # an empty file can't be mapped
+        return np.memmap(path, dtype='<f8', mode='r').reshape(-1, 2)
+    return np.fromfile(path, dtype='<f8').reshape(-1, 2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate points and save them to a binary file')
+    parser.add_argument('path', help='Output file (.npy, or raw float64 for any other extension)')
+    parser.add_argument('-n', type=int, help='The number of points to generate', default=10)
+    parser.add_argument('-d', '--dist', '--distribution',
+                        help='The distribution from which to generate points',
+                        default='uniform'
+                        )
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    write_points(args.path, generate_point_array(args.dist, args.n, args.seed))
@@ -3,20 +3,30 @@ from time import time
 
 from generate import generate_random_points
 from convex_hull import compute_hull
-from plotting import plot_points, draw_hull, title, show_plot
 
 
-def main(n: int, distribution: str, seed: int | None):
-    points = generate_random_points(distribution, n, seed)
+def plot_hull(points: list[tuple[float, float]], hull_points: list[tuple[float, float]], label: str):
+    from plotting import plot_points, draw_hull, title, show_plot
+
     plot_points(points)
+    draw_hull(hull_points)
+    title(label)
+    show_plot()
+
+
+def main(n: int, distribution: str, seed: int | None, plot: bool = False):
+    points = generate_random_points(distribution, n, seed)
 
     start = time()
     hull_points = compute_hull(points)
     end = time()
 
-    draw_hull(hull_points)
-    title(f'{n} {distribution} points: {round(end - start, 4)} seconds')
-    show_plot()
+    label = f'{n} {distribution} points: {round(end - start, 4)} seconds'
+    print(label)
+    print(f'Hull has {len(hull_points)} points')
+
+    if plot:
+        plot_hull(points, hull_points, label)
 
 
 if __name__ == '__main__':
@@ -33,7 +43,8 @@ if __name__ == '__main__':
                         default='uniform'
                         )
     parser.add_argument('--seed', type=int, default=None, help="Random seed")
-    parser.add_argument('--debug', action='store_true', help='Turn on debug plotting')
+    parser.add_argument('--plot', action='store_true', help='Plot the points and hull')
+    parser.add_argument('--debug', action='store_true', help='Turn on debug plotting (implies --plot)')
     args = parser.parse_args()
 
     if args.debug:
@@ -45,4 +56,4 @@ if __name__ == '__main__':
         plt.switch_backend('QtAgg')
         plt.ion()
 
-    main(args.n, args.dist, args.seed)
+    main(args.n, args.dist, args.seed, args.plot or args.debug)
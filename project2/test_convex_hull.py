@@ -2,7 +2,7 @@ from byu_pytest_utils import max_score
 
 from test_utils import is_convex_hull
 
-from convex_hull import compute_hull
+from convex_hull import compute_hull, IncrementalHull, DynamicHull
 from generate import generate_random_points
 
 
@@ -57,4 +57,144 @@ def test_uniform_distribution_100():
 def test_uniform_distribution_10000():
     points_10000 = generate_random_points('uniform', 1000, 123)
     candidate_hull_10000 = compute_hull(points_10000)
-    assert is_convex_hull(candidate_hull_10000, points_10000)
\ No newline at end of file
+    assert is_convex_hull(candidate_hull_10000, points_10000)
+
+def test_numpy_engine_matches_reference():
+    import numpy as np
+    from convex_hull_np import compute_hull_indices, compute_hull_array
+
+    for distribution in ['uniform', 'guassian', 'circle']:
+        points = generate_random_points(distribution, 5000, 312)
+        array = np.array(points)
+        indices = compute_hull_indices(array)
+        candidate_hull = [points[i] for i in indices]
+        assert is_convex_hull(candidate_hull, points)
+        assert sorted(candidate_hull) == sorted(compute_hull(list(points)))
+        assert compute_hull_array(array).tolist() == [list(p) for p in candidate_hull]
+
+
+def test_akl_toussaint_prefilter():
+    import numpy as np
+    from convex_hull_np import compute_hull_indices, akl_toussaint_filter
+
+    for distribution in ['uniform', 'guassian', 'circle']:
+        points = generate_random_points(distribution, 5000, 312)
+        array = np.array(points)
+        survivors = set(akl_toussaint_filter(array).tolist())
+        assert set(compute_hull_indices(array).tolist()) <= survivors
+        assert compute_hull_indices(array, prefilter=True).tolist() == compute_hull_indices(array).tolist()
+        assert is_convex_hull(compute_hull(list(points), prefilter=True), points)
+
+
+def test_parallel_strips():
+    for distribution in ['uniform', 'circle']:
+        points = generate_random_points(distribution, 5000, 312)
+        candidate_hull = compute_hull(list(points), workers=3)
+        assert is_convex_hull(candidate_hull, points)
+        assert sorted(candidate_hull) == sorted(compute_hull(list(points)))
+
+
+def test_incremental_hull():
+    points = generate_random_points('uniform', 5000, 312)
+    stream = IncrementalHull()
+    for start in range(0, len(points), 1000):
+        stream.add_many(points[start:start + 1000])
+        seen = points[:start + 1000]
+        assert is_convex_hull(stream.hull(), seen)
+        assert sorted(stream.hull()) == sorted(compute_hull(list(seen)))
+
+    assert stream.add((0.0, 0.0)) is False
+    assert stream.add((5.0, 5.0)) is True
+    assert (5.0, 5.0) in stream.hull()
+
+
+def test_dynamic_hull():
+    points = generate_random_points('uniform', 3000, 312)
+    dynamic = DynamicHull(points, bucket_size=64)
+    removed = points[::3]
+    for p in removed:
+        assert dynamic.remove(p)
+    assert not dynamic.remove((5.0, 5.0))
+    live = [p for p in points if p not in set(removed)]
+    assert len(dynamic) == len(live)
+    assert sorted(dynamic.hull()) == sorted(compute_hull(list(live)))
+
+    window = DynamicHull(window=100, bucket_size=64)
+    for t, p in enumerate(points):
+        window.add(p, timestamp=t)
+        if t % 500 == 499:
+            recent = points[max(0, t - 100):t + 1]
+            assert is_convex_hull(window.hull(now=t), recent)
+    assert window.expire(now=len(points) + 100) == 101
+    assert window.hull() == []
+
+    # Tiny buckets grow the bucket tree and reuse the slots of expired buckets
+    window = DynamicHull(window=50, bucket_size=3)
+    for t, p in enumerate(points[:1000]):
+        window.add(p, timestamp=t)
+        if t % 97 == 0:
+            assert window.hull(now=t) == IncrementalHull(points[max(0, t - 50):t + 1]).hull()
+
+
+def test_chan_method():
+    for distribution in ['uniform', 'guassian', 'circle']:
+        points = generate_random_points(distribution, 5000, 312)
+        candidate_hull = compute_hull(list(points), method='chan')
+        assert is_convex_hull(candidate_hull, points)
+        assert sorted(candidate_hull) == sorted(compute_hull(list(points)))
+
+
+def test_point_array_generation(tmp_path):
+    import numpy as np
+    from generate_np import generate_point_array, write_points, read_points
+
+    for distribution in ['uniform', 'guassian', 'circle', 'sphere']:
+        array = generate_point_array(distribution, 5000, 312)
+        assert array.shape == (5000, 2)
+        assert len(np.unique(array[:, 0])) == 5000
+        assert np.array_equal(array, generate_point_array(distribution, 5000, 312))
+
+        points = [tuple(p) for p in array.tolist()]
+        assert is_convex_hull(compute_hull(list(points)), points)
+
+    for name in ['points.npy', 'points.f64']:
+        write_points(str(tmp_path / name), array)
+        assert np.array_equal(read_points(str(tmp_path / name)), array)
+
+
+def test_hull_from_file(tmp_path):
+    from generate_np import generate_point_array, write_points
+    from convex_hull_np import hull_from_file
+
+    array = generate_point_array('circle', 20000, 312)
+    points = [tuple(p) for p in array.tolist()]
+    expected = sorted(compute_hull(list(points)))
+    for name, chunk_size, workers in [('points.npy', 1000, None), ('points.f64', 7000, 2)]:
+        write_points(str(tmp_path / name), array)
+        candidate_hull = hull_from_file(str(tmp_path / name), chunk_size, workers)
+        assert is_convex_hull(candidate_hull, points)
+        assert sorted(candidate_hull) == expected
+
+
+def test_hull_from_file_repeated_x(tmp_path):
+    import numpy as np
+    from generate_np import write_points
+    from convex_hull_np import hull_from_file
+
+    # An integer grid, and a square whose vertical edges land in different chunks
+    grid = np.random.default_rng(312).integers(0, 10, (500, 2)).astype(np.float64)
+    square = np.array([(0, 0), (2, 2), (0, 2), (2, 1), (2, 0), (0, 1), (1, 1)], dtype=np.float64)
+    for array in [grid, square]:
+        points = [tuple(p) for p in array.tolist()]
+        write_points(str(tmp_path / 'points.f64'), array)
+        for chunk_size in [1, 2, 10]:
+            candidate_hull = hull_from_file(str(tmp_path / 'points.f64'), chunk_size)
+            assert candidate_hull == IncrementalHull(points).hull()
+
+
+def test_hull_code_is_headless():
+    import sys
+
+    compute_hull(generate_random_points('uniform', 100, 312))
+    assert 'plotting' not in sys.modules
+    assert 'matplotlib' not in sys.modules
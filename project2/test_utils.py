@@ -1,16 +1,4 @@
-# Mock out the plotting library
-# As long as test_utils is imported first
-#  the plotting library will be full of no-op functions
-import sys
-
-plotting = type(sys)('plotting')
-plotting.plot_points = lambda *args, **kwargs: None
-plotting.draw_hull = lambda *args, **kwargs: None
-plotting.draw_line = lambda *args, **kwargs: None
-plotting.circle_point = lambda *args, **kwargs: None
-plotting.show_plot = lambda *args, **kwargs: None
-plotting.title = lambda *args, **kwargs: None
-sys.modules['plotting'] = plotting
+import numpy as np
 
 
 def cross(o: tuple[float, float], a: tuple[float, float], b: tuple[float, float]) -> float:
@@ -56,6 +44,13 @@ def is_convex_polygon(polygon: list[tuple[float, float]]) -> bool:
         elif sign != current_sign:
             return False
 
+    # Consistent turns still allow a star that winds around twice; a convex
+    # polygon also sweeps its vertices in order around its first vertex
+    for i in range(1, n - 1):
+        fan = cross(polygon[0], polygon[i], polygon[i + 1])
+        if (fan < 0) if sign else (fan > 0):
+            return False
+
     return True
 
 
@@ -71,8 +66,40 @@ def is_convex_hull(candidate_hull: list[tuple[float, float]], points: list[tuple
         return False
 
     # Ensure all other points are inside or on the boundary of the candidate hull
-    for point in points:
-        if point not in candidate_hull and not is_point_in_polygon(point, candidate_hull):
-            return False
-
-    return True
+    vertices = set(candidate_hull)
+    others = [point for point in points if point not in vertices]
+    return bool(np.all(points_in_convex_polygon(np.array(others, dtype=np.float64).reshape(-1, 2),
+                                                candidate_hull)))
+
+
+def points_in_convex_polygon(points: np.ndarray, polygon: list[tuple[float, float]]) -> np.ndarray:
+    """
+    For each row of points, whether it is inside or on the boundary of the
+    convex polygon (either orientation). The polygon is fanned from its first
+    vertex and every point's wedge is found by a vectorized binary search,
+    so this is O(n log h) instead of a winding-number loop per point.
+    """
+    hull = np.array(polygon, dtype=np.float64)
+    if cross(polygon[0], polygon[1], polygon[2]) <= 0:
+        hull = np.concatenate([hull[:1], hull[:0:-1]])  # make it counterclockwise
+
+    def cross_many(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (b[..., 0] - o[..., 0])
+
+    origin = hull[0]
+    # A polygon with no area has no inside (the winding number is 0 everywhere)
+    if np.sum(cross_many(origin, hull[1:-1], hull[2:])) <= 0:
+        return np.zeros(len(points), dtype=bool)
+
+    # Largest i in [1, h - 2] with the point left of (or on) the ray origin -> hull[i]
+    lo = np.ones(len(points), dtype=np.intp)
+    hi = np.full(len(points), len(hull) - 2, dtype=np.intp)
+    while np.any(searching := lo < hi):
+        mid = (lo + hi + 1) // 2
+        left = cross_many(origin, hull[mid], points) >= 0
+        lo = np.where(searching & left, mid, lo)
+        hi = np.where(searching & ~left, mid - 1, hi)
+
+    return ((cross_many(origin, hull[1], points) >= 0)
+            & (cross_many(origin, hull[-1], points) <= 0)
+            & (cross_many(hull[lo], hull[lo + 1], points) >= 0))
@@ -4,7 +4,6 @@ import random
 from math import inf
 from time import time
 
-from plotting import plot_points, draw_path, circle_point, title, show_plot, plot_weights
 from network_routing import find_shortest_path_with_array, find_shortest_path_with_heap
 
 
@@ -43,7 +42,25 @@ def generate_graph(seed, size, density, noise) -> tuple[
     return positions, weights
 
 
-def main(seed: int, size: int, density: float, noise: float, source: int, target: int):
+def plot_results(positions: list[tuple[float, float]], weights: dict[int, dict[int, float]],
+                 source: int, target: int, path: list[int], label: str):
+    from plotting import plot_points, draw_path, circle_point, title, show_plot, plot_weights
+
+    plot_points(positions)
+    if sum(len(edges) for edges in weights.values()) < 50:
+        # If the number of non-inf edges is < 50
+        plot_weights(positions, weights)
+
+    circle_point(positions[source], c='r')
+    circle_point(positions[target], c='b')
+
+    draw_path(positions, path)
+
+    title(label)
+    show_plot()
+
+
+def main(seed: int, size: int, density: float, noise: float, source: int, target: int, plot: bool = False):
     start = time()
     positions, weights = generate_graph(seed, size, density, noise)
     end = time()
@@ -53,26 +70,17 @@ def main(seed: int, size: int, density: float, noise: float, source: int, target
 
     print(f'Direct cost from {source} to {target}: {weights[source].get(target, math.inf)}')
 
-    plot_points(positions)
-    if num_edges < 50:
-        # If the number of non-inf edges is < 50
-        plot_weights(positions, weights)
-
-    circle_point(positions[source], c='r')
-    circle_point(positions[target], c='b')
-
     start = time()
     path, cost = find_shortest_path_with_heap(weights, source, target)
     end = time()
     heap_time = end - start
+    heap_path = path
     print()
     print('-- Heap --')
     print('Path:', path)
     print('Cost:', cost)
     print('Time:', heap_time)
 
-    draw_path(positions, path)
-
     start = time()
     path, cost = find_shortest_path_with_array(weights, source, target)
     end = time()
@@ -83,8 +91,9 @@ def main(seed: int, size: int, density: float, noise: float, source: int, target
     print('Cost:', cost)
     print('Time:', array_time)
 
-    title(f'Cost: {cost}, Heap: {round(heap_time, 4)}, Array: {round(array_time, 4)}')
-    show_plot()
+    if plot:
+        plot_results(positions, weights, source, target, heap_path,
+                     f'Cost: {cost}, Heap: {round(heap_time, 4)}, Array: {round(array_time, 4)}')
 
 
 if __name__ == '__main__':
@@ -100,6 +109,7 @@ if __name__ == '__main__':
     parser.add_argument('--noise', type=float, default=0, help='How non-euclidean are the edge weights')
     parser.add_argument('--source', type=int, default=0, help='Starting node')
     parser.add_argument('--target', type=int, default=9, help='Target node')
+    parser.add_argument('--plot', action='store_true', help='Plot the network and the shortest path')
     parser.add_argument('--debug', action='store_true', help='Turn on debug plotting')
     args = parser.parse_args()
 
@@ -116,7 +126,7 @@ if __name__ == '__main__':
     if args.target is None:
         args.target = args.n - 1
 
-    main(args.seed, args.n, args.density, args.noise, args.source, args.target)
+    main(args.seed, args.n, args.density, args.noise, args.source, args.target, args.plot)
 
     # You can use a loop like the following to generate data for your tables:
     for n in [1000, 2000, 3000, 4000, 5000, 6000]: